@@ -0,0 +1,41 @@
+"""Add indexes for task listing and overdue scan
+
+Revision ID: 3f9a1c2d7b4e
+Revises: e0372bb1cbb6
+Create Date: 2026-10-16 10:12:04.318527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7b4e'
+down_revision: Union[str, Sequence[str], None] = 'e0372bb1cbb6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tasks_project_id_created_at",
+        "tasks",
+        ["project_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_open_deadline",
+        "tasks",
+        ["deadline"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'done'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_open_deadline", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_created_at", table_name="tasks")
@@ -0,0 +1,40 @@
+"""Add indexes for cross-project task queries
+
+Revision ID: 8b2d4e6f1a3c
+Revises: 3f9a1c2d7b4e
+Create Date: 2026-10-16 14:37:51.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4e6f1a3c'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c2d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tasks_created_at_id",
+        "tasks",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_deadline_id",
+        "tasks",
+        ["deadline", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_deadline_id", table_name="tasks")
+    op.drop_index("ix_tasks_created_at_id", table_name="tasks")
@@ -0,0 +1,41 @@
+"""Add revision and updated_at to projects
+
+Revision ID: d8f1b3c5e7a9
+Revises: c4e7a9b2d5f8
+Create Date: 2026-10-16 16:48:33.105872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f1b3c5e7a9'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a9b2d5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "projects",
+        sa.Column("revision", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "projects",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("projects", "updated_at")
+    op.drop_column("projects", "revision")
@@ -0,0 +1,39 @@
+"""Add job_state table
+
+Revision ID: f2a4c6e8b0d1
+Revises: d8f1b3c5e7a9
+Create Date: 2026-10-16 23:04:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a4c6e8b0d1'
+down_revision: Union[str, Sequence[str], None] = 'd8f1b3c5e7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_state",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("last_processed_date", sa.Date(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("job_state")
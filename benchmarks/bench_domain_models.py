@@ -0,0 +1,66 @@
+"""
+Micro-benchmark: cost of building domain Task objects.
+
+Compares the validating constructor (Task(...)) with the trusted
+rehydration path used by the repositories (Task.from_trusted(...)),
+reporting time per object and memory held by N tasks.
+
+Run:
+    poetry run python -m benchmarks.bench_domain_models [N]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, UTC
+from typing import Callable, List
+from uuid import uuid4
+
+from todo_app.models import Task
+
+
+def _rows(n: int) -> List[dict]:
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": str(uuid4()),
+            "title": f"Task number {i}",
+            "description": "Some description with a handful of words in it",
+            "status": "todo",
+            "deadline": date(2030, 1, 1),
+            "created_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def _measure(label: str, build: Callable[[dict], Task], rows: List[dict]) -> None:
+    start = time.perf_counter()
+    objs = [build(r) for r in rows]
+    elapsed = time.perf_counter() - start
+    del objs
+
+    tracemalloc.start()
+    objs = [build(r) for r in rows]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+
+    n = len(rows)
+    print(
+        f"{label:<14} {elapsed * 1e9 / n:8.0f} ns/object   "
+        f"{current / 1024 / 1024:8.2f} MiB for {n} tasks"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = _rows(n)
+    _measure("Task(...)", lambda r: Task(**r), rows)
+    _measure("from_trusted", lambda r: Task.from_trusted(**r), rows)
+
+
+if __name__ == "__main__":
+    main()
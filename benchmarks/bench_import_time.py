@@ -0,0 +1,67 @@
+"""
+Import-time budget for the modules CLI commands and workers start from.
+
+Each module is imported in a fresh interpreter under `python -X importtime`,
+a few rounds, keeping the fastest cumulative time. The run fails when a module
+goes over its budget, or when it pulls in a heavy dependency it should only
+load on first use (e.g. SQLAlchemy for the domain models, FastAPI for the
+todo_app.api package, which builds the app lazily).
+
+Run:
+    poetry run python -m benchmarks.bench_import_time [ROUNDS]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+# module -> (budget in ms, top-level packages it must not import)
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "todo_app.models": (150.0, ("sqlalchemy", "psycopg2", "dotenv", "fastapi")),
+    "todo_app.api": (50.0, ("sqlalchemy", "psycopg2", "dotenv", "fastapi")),
+    "todo_app.commands.scheduler": (1_500.0, ("psycopg2", "dotenv", "fastapi")),
+}
+
+_PRINT_MODULES = "import sys; print('\\n'.join(sys.modules))"
+
+
+def _import_once(module: str) -> Tuple[float, Set[str]]:
+    """Cumulative import time of `module` in ms, and the top-level packages loaded."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {_PRINT_MODULES}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"{module} does not appear in the -X importtime output")
+    loaded = {name.split(".")[0] for name in proc.stdout.split()}
+    return cumulative_us / 1e3, loaded
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    failures: List[str] = []
+    for module, (budget_ms, forbidden) in BUDGETS.items():
+        _import_once(module)  # warm-up: writes the .pyc files
+        best, loaded = min((_import_once(module) for _ in range(rounds)), key=lambda r: r[0])
+        status = "ok" if best <= budget_ms else "OVER BUDGET"
+        print(f"{module:<30} {best:9.1f} ms   budget {budget_ms:7.0f} ms   {status}")
+        if best > budget_ms:
+            failures.append(f"{module}: {best:.1f} ms > {budget_ms:.0f} ms")
+        eager = sorted(loaded.intersection(forbidden))
+        if eager:
+            failures.append(f"{module}: imports {', '.join(eager)} eagerly")
+    assert not failures, "import-time budget exceeded:\n  " + "\n  ".join(failures)
+
+
+if __name__ == "__main__":
+    main()
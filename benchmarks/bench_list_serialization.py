@@ -0,0 +1,83 @@
+"""
+Micro-benchmark: serializing a task list response.
+
+Compares the Pydantic path (one TaskResponse per item via model_validate,
+then validation against the response_model and JSON rendering, as FastAPI
+does for a returned model) with the fast path used by the list endpoints
+(domain objects -> dicts -> orjson bytes), for 1k and 10k tasks by default.
+
+Run:
+    poetry run python -m benchmarks.bench_list_serialization [N ...]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from datetime import date
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from todo_app.api.controller_schemas.task_response_schema import TaskListResponse, TaskResponse
+from todo_app.api.responses import FastJSONResponse, task_dict
+from todo_app.models import Task
+
+_list_adapter = TypeAdapter(TaskListResponse)
+
+
+def _tasks(n: int) -> List[Task]:
+    return [
+        Task(
+            title=f"Task number {i}",
+            description="Some description with a handful of words in it",
+            deadline=date(2030, 1, 1),
+        )
+        for i in range(n)
+    ]
+
+
+def pydantic_path(tasks: List[Task]) -> bytes:
+    model = TaskListResponse(
+        tasks=[TaskResponse.model_validate(t) for t in tasks],
+        total=len(tasks),
+        next_cursor=None,
+    )
+    # What FastAPI does with a returned model: validate against response_model, dump, render
+    validated = _list_adapter.validate_python(model)
+    content = _list_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast_path(tasks: List[Task]) -> bytes:
+    content = {"tasks": [task_dict(t) for t in tasks], "total": len(tasks), "next_cursor": None}
+    return FastJSONResponse(content).body
+
+
+def _measure(label: str, serialize: Callable[[List[Task]], bytes], tasks: List[Task]) -> float:
+    serialize(tasks)  # warm-up
+    rounds = max(3, 50_000 // len(tasks))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serialize(tasks)
+    per_call = (time.perf_counter() - start) / rounds
+    print(
+        f"{label:<10} n={len(tasks):<7} {per_call * 1e3:9.2f} ms/response   "
+        f"{len(tasks) / per_call:12,.0f} items/s"
+    )
+    return per_call
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000]
+    for n in sizes:
+        tasks = _tasks(n)
+        assert json.loads(pydantic_path(tasks)) == json.loads(fast_path(tasks))
+        slow = _measure("pydantic", pydantic_path, tasks)
+        fast = _measure("fast", fast_path, tasks)
+        print(f"{'':<10} speed-up x{slow / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from todo_app.api import app
+from todo_app.api.dependencies import get_project_service, get_task_service
+from todo_app.cache import get_cache
+from todo_app.repositories.in_memory_repo import InMemoryRepo
+from todo_app.services import AsyncService, ProjectService, TaskService
+
+
+@pytest.fixture
+def repo() -> InMemoryRepo:
+    return InMemoryRepo()
+
+
+@pytest.fixture
+def client(repo: InMemoryRepo):
+    """The API over an InMemoryRepo: no database, no cache."""
+    app.dependency_overrides[get_project_service] = lambda: AsyncService.in_threadpool(
+        ProjectService(repo)
+    )
+    app.dependency_overrides[get_task_service] = lambda: AsyncService.in_threadpool(
+        TaskService(project_repo=repo, task_repo=repo)
+    )
+    app.dependency_overrides[get_cache] = lambda: None
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
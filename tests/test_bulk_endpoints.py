@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+from todo_app.models import Project, Task
+
+SOON = (date.today() + timedelta(days=5)).isoformat()
+LATER = (date.today() + timedelta(days=30)).isoformat()
+
+
+def _project(repo) -> Project:
+    project = Project(name="p")
+    repo.add_project(project)
+    return project
+
+
+def test_bulk_create_reports_each_invalid_item(client, repo):
+    project = _project(repo)
+    r = client.post(f"/projects/{project.id}/tasks:bulk", json={"tasks": [
+        {"title": "ok", "deadline": SOON},
+        {"title": " ".join(["w"] * 31)},
+        {"title": "also ok", "status": "doing"},
+    ]})
+    assert r.status_code == 201
+    body = r.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [item["index"] for item in body["results"]] == [0, 1, 2]
+    assert body["results"][1]["task"] is None
+    assert "30 words" in body["results"][1]["error"]
+    assert {t.title for t in repo.list_tasks_of_project(project.id)} == {"ok", "also ok"}
+
+
+def test_bulk_create_in_unknown_project_is_a_400(client):
+    r = client.post("/projects/nope/tasks:bulk", json={"tasks": [{"title": "t"}]})
+    assert r.status_code == 400
+
+
+def test_bulk_status_by_filter(client, repo):
+    project = _project(repo)
+    other = Project(name="other")
+    repo.add_project(other)
+    soon = Task(title="soon", deadline=date.fromisoformat(SOON))
+    later = Task(title="later", deadline=date.fromisoformat(LATER))
+    undated = Task(title="undated")
+    for task in (soon, later, undated):
+        repo.add_task(project, task)
+    repo.add_task(other, Task(title="elsewhere", deadline=date.fromisoformat(SOON)))
+
+    r = client.patch(f"/projects/{project.id}/tasks:bulk-status",
+                     json={"status": "done", "filter": {"deadline_to": SOON}})
+    assert r.status_code == 200
+    assert r.json() == {"affected": 1}
+    assert (soon.status, later.status, undated.status) == ("done", "todo", "todo")
+    assert repo.list_tasks_of_project(other.id)[0].status == "todo"
+
+    # ids and filter together: both must match
+    r = client.patch(f"/projects/{project.id}/tasks:bulk-status", json={
+        "status": "doing", "task_ids": [soon.id, later.id], "filter": {"status": ["todo"]},
+    })
+    assert r.json() == {"affected": 1}
+    assert (soon.status, later.status) == ("done", "doing")
+
+
+def test_bulk_delete_by_filter(client, repo):
+    project = _project(repo)
+    for i, status in enumerate(["todo", "done", "done", "doing"]):
+        repo.add_task(project, Task(title=f"t{i}", status=status))
+
+    r = client.post(f"/projects/{project.id}/tasks:bulk-delete", json={"filter": {"status": ["done"]}})
+    assert r.status_code == 200
+    assert r.json() == {"affected": 2}
+    assert sorted(t.status for t in repo.list_tasks_of_project(project.id)) == ["doing", "todo"]
+    assert repo.list_tasks_by_status("done") == []
+
+
+def test_bulk_selection_is_required(client, repo):
+    project = _project(repo)
+    r = client.post(f"/projects/{project.id}/tasks:bulk-delete", json={})
+    assert r.status_code == 422
+    r = client.patch(f"/projects/{project.id}/tasks:bulk-status", json={"status": "done"})
+    assert r.status_code == 422
@@ -0,0 +1,41 @@
+from todo_app.cache.backends import LRUCache
+from todo_app.cache.read_through import ReadThroughCache
+from todo_app.models import Project, Task
+from todo_app.repositories import CachedProjectRepository, CachedTaskRepository
+from todo_app.repositories.in_memory_repo import InMemoryRepo
+
+
+def _worker(db: InMemoryRepo):
+    """Cached repositories of one worker: its own memory cache over the shared database."""
+    cache = ReadThroughCache(LRUCache(100))
+    projects = CachedProjectRepository(db, cache)
+    tasks = CachedTaskRepository(db, cache, revision_of=db.get_project_revision)
+    return projects, tasks
+
+
+def test_write_in_another_worker_is_not_hidden_by_a_stale_project_entry():
+    db = InMemoryRepo()
+    project = Project(name="old")
+    db.add_project(project)
+    projects_a, _ = _worker(db)
+    projects_b, _ = _worker(db)
+
+    assert projects_a.get_project_by_id(project.id, include_tasks=False).name == "old"
+    projects_b.update_project(db.get_project_by_id(project.id), new_name="new")
+
+    assert projects_a.get_project_by_id(project.id, include_tasks=False).name == "new"
+
+
+def test_write_in_another_worker_is_not_hidden_by_a_stale_task_entry():
+    db = InMemoryRepo()
+    project = Project(name="p")
+    db.add_project(project)
+    task = Task(title="old")
+    db.add_task(project, task)
+    _, tasks_a = _worker(db)
+    _, tasks_b = _worker(db)
+
+    assert tasks_a.get_task_in_project(project.id, task.id).title == "old"
+    tasks_b.update_task(task.id, title="new")
+
+    assert tasks_a.get_task_in_project(project.id, task.id).title == "new"
@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+
+from todo_app.scheduler.deadlines import DeadlineIndex
+
+D0 = date(2030, 1, 1)
+
+
+def _day(n: int) -> date:
+    return D0 + timedelta(days=n)
+
+
+def test_pop_overdue_returns_expired_tasks_in_deadline_order():
+    index = DeadlineIndex()
+    index.track("b", _day(2), "todo")
+    index.track("a", _day(1), "doing")
+    index.track("c", _day(5), "todo")
+    assert index.next_deadline() == _day(1)
+
+    assert index.pop_overdue(_day(1)) == []
+    assert index.pop_overdue(_day(3)) == [("a", _day(1)), ("b", _day(2))]
+    assert len(index) == 1
+    assert index.next_deadline() == _day(5)
+
+
+def test_done_or_undated_tasks_are_dropped():
+    index = DeadlineIndex()
+    index.track("a", _day(1), "todo")
+    index.track("b", _day(2), "todo")
+    index.track("a", _day(1), "done")
+    index.track("b", None, "todo")
+    assert len(index) == 0
+    assert index.next_deadline() is None
+    assert index.pop_overdue(_day(10)) == []
+
+
+def test_moved_deadline_leaves_no_stale_entry():
+    index = DeadlineIndex()
+    index.track("a", _day(1), "todo")
+    index.track("a", _day(7), "todo")
+    assert index.next_deadline() == _day(7)
+    assert index.pop_overdue(_day(5)) == []
+    assert index.pop_overdue(_day(8)) == [("a", _day(7))]
+
+
+def test_restore_skips_tasks_tracked_again():
+    index = DeadlineIndex()
+    index.track("a", _day(1), "todo")
+    index.track("b", _day(1), "todo")
+    popped = index.pop_overdue(_day(2))
+    index.track("b", _day(9), "todo")  # edited while its close was in flight
+
+    index.restore(popped)
+    assert index.pop_overdue(_day(20)) == [("a", _day(1)), ("b", _day(9))]
+
+
+def test_heap_is_compacted_after_many_updates():
+    index = DeadlineIndex()
+    for n in range(1000):
+        index.track("a", _day(n % 50), "todo")
+    assert len(index) == 1
+    assert len(index._heap) <= 2 * len(index) + 65
+    assert index.pop_overdue(_day(100)) == [("a", _day(999 % 50))]
+
+
+def test_rebuild_replaces_the_content():
+    index = DeadlineIndex()
+    index.track("old", _day(0), "todo")
+    index.rebuild([("a", _day(3)), ("b", _day(2))])
+    assert len(index) == 2
+    assert index.pop_overdue(_day(4)) == [("b", _day(2)), ("a", _day(3))]
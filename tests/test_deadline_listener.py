@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from todo_app.repositories.in_memory_repo import InMemoryRepo
+from todo_app.scheduler.deadlines import DeadlineIndex
+from todo_app.services import ProjectService, TaskService
+
+
+def test_bulk_status_change_reaches_deadline_index(repo: InMemoryRepo):
+    index = DeadlineIndex()
+    service = TaskService(project_repo=repo, task_repo=repo, on_task_saved=index.track)
+    project = ProjectService(repo).create_project(name="p")
+    deadline = (date.today() + timedelta(days=3)).isoformat()
+    tasks = [
+        service.add_task(project_id=project.id, title=f"t{i}", deadline_str=deadline)
+        for i in range(3)
+    ]
+    assert len(index) == 3
+
+    closed = service.change_status_many(project.id, "done", task_ids=[t.id for t in tasks[:2]])
+    assert closed == 2
+    assert len(index) == 1
+
+    # Reopened tasks are due again
+    reopened = service.change_status_many(project.id, "doing", task_ids=[t.id for t in tasks])
+    assert reopened == 3
+    assert len(index) == 3
+    assert index.pop_overdue(date.today() + timedelta(days=4)) == sorted(
+        (t.id, tasks[0].deadline) for t in tasks
+    )
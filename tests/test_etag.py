@@ -0,0 +1,50 @@
+from todo_app.models import Project, Task
+
+
+def _seed(repo):
+    project = Project(name="p")
+    repo.add_project(project)
+    task = Task(title="t")
+    repo.add_task(project, task)
+    return project, task
+
+
+def test_project_etag_and_304(client, repo):
+    project, _ = _seed(repo)
+    url = f"/projects/{project.id}"
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers["ETag"] == etag
+    assert r.content == b""
+    # Weak comparison, and any tag of a list
+    assert client.get(url, headers={"If-None-Match": f'"x", {etag[2:]}'}).status_code == 304
+
+    client.put(url, json={"description": "changed"})
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+    assert r.json()["description"] == "changed"
+
+
+def test_task_change_changes_project_and_task_etags(client, repo):
+    project, task = _seed(repo)
+    project_url = f"/projects/{project.id}"
+    task_url = f"/projects/{project.id}/tasks/{task.id}"
+    list_url = f"/projects/{project.id}/tasks"
+    etags = {url: client.get(url).headers["ETag"] for url in (project_url, task_url, list_url)}
+    for url, etag in etags.items():
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"{task_url}/status", json={"status": "doing"})
+    for url, etag in etags.items():
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(task_url).json()["status"] == "doing"
+
+
+def test_missing_project_is_a_404_even_with_if_none_match(client):
+    assert client.get("/projects/nope", headers={"If-None-Match": "*"}).status_code == 404
+    assert client.get("/projects/nope/tasks/t", headers={"If-None-Match": "*"}).status_code == 404
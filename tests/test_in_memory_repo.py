@@ -0,0 +1,83 @@
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from todo_app.models import Project, Task
+from todo_app.repositories.in_memory_repo import InMemoryRepo
+from todo_app.repositories.task_filter import TaskFilter
+
+D0 = date(2030, 1, 1)
+STATUSES = ("todo", "doing", "done")
+
+
+def _seed(repo: InMemoryRepo):
+    """Two projects; statuses and deadlines spread unevenly so each index can be the smallest."""
+    projects = [Project(name="a"), Project(name="b")]
+    for project in projects:
+        repo.add_project(project)
+    for i in range(30):
+        deadline = D0 + timedelta(days=i % 10) if i % 3 else None
+        status = "done" if i < 20 else STATUSES[i % 2]
+        repo.add_task(projects[i % 2], Task(title=f"t{i}", status=status, deadline=deadline))
+    return projects
+
+
+def _brute_force(repo: InMemoryRepo, projects, project_id, f: TaskFilter):
+    tasks = [t for p in projects if project_id in (None, p.id) for t in repo.list_tasks_of_project(p.id)]
+    allowed = f.project_ids
+    return sorted(
+        t.id for t in tasks
+        if f.matches(t) and (allowed is None or repo.get_task_project_id(t.id) in allowed)
+    )
+
+
+FILTERS = [
+    TaskFilter(),
+    TaskFilter(statuses=("todo",)),
+    TaskFilter(statuses=("done",)),
+    TaskFilter(statuses=("todo", "todo", "doing")),
+    TaskFilter(due_from=D0 + timedelta(days=8)),
+    TaskFilter(due_to=D0 + timedelta(days=1)),
+    TaskFilter(due_from=D0 + timedelta(days=2), due_to=D0 + timedelta(days=2)),
+    TaskFilter(statuses=("todo",), due_from=D0, due_to=D0 + timedelta(days=9)),
+    TaskFilter(statuses=("done",), due_from=D0 + timedelta(days=9)),
+    TaskFilter(due_from=D0 + timedelta(days=20)),
+]
+
+
+@pytest.mark.parametrize("f", FILTERS)
+def test_filtered_tasks_match_a_full_scan(repo, f):
+    a, b = _seed(repo)
+    for project_id, project_ids in ((None, None), (a.id, None), (None, (b.id,)),
+                                    (a.id, (a.id, b.id)), (a.id, (b.id,))):
+        scoped = replace(f, project_ids=project_ids)
+        got = [t.id for t in repo._filtered_tasks(project_id, scoped)]
+        assert len(got) == len(set(got))
+        expected = _brute_force(repo, (a, b), project_id, scoped)
+        if project_id is not None and project_ids is not None and project_id not in project_ids:
+            expected = []
+        assert sorted(got) == expected
+
+
+def test_duplicated_status_lists_each_task_once(repo):
+    project, _ = _seed(repo)
+    f = TaskFilter(statuses=("doing", "doing"))
+    assert repo.count_tasks(project.id, f) == repo.count_tasks(project.id, TaskFilter(statuses=("doing",)))
+    page = repo.query_tasks(TaskFilter(statuses=("todo", "todo")), limit=100)
+    ids = [t.id for _, t in page.items]
+    assert len(ids) == len(set(ids)) == len(repo.list_tasks_by_status("todo"))
+
+
+def test_indexes_follow_task_changes(repo):
+    project, _ = _seed(repo)
+    task = repo.list_tasks_of_project(project.id)[-1]
+    repo.update_task(task.id, deadline_str=(D0 + timedelta(days=50)).isoformat(), status="doing")
+
+    assert [t.id for t in repo.list_tasks_by_deadline(due_from=D0 + timedelta(days=50))] == [task.id]
+    assert task.id in {t.id for t in repo.list_tasks_by_status("doing")}
+    assert all(t.id != task.id for s in ("todo", "done") for t in repo.list_tasks_by_status(s))
+
+    repo.delete_task(task.id)
+    assert repo.list_tasks_by_deadline(due_from=D0 + timedelta(days=50)) == []
+    assert task.id not in {t.id for t in repo.list_tasks_by_status("doing")}
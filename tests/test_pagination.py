@@ -0,0 +1,114 @@
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from todo_app.models import Project, Task
+from todo_app.repositories.in_memory_repo import InMemoryRepo
+from todo_app.repositories.pagination import decode_cursor, encode_cursor, is_after
+from todo_app.repositories.task_filter import decode_task_cursor
+
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+D0 = date(2030, 1, 1)
+
+
+def _seed(repo: InMemoryRepo) -> Project:
+    """Six tasks: equal created_at for some (ties broken by id), two without deadline."""
+    project = Project(name="p")
+    repo.add_project(project)
+    deadlines = [D0, None, D0 + timedelta(days=2), D0, None, D0 + timedelta(days=1)]
+    for i, deadline in enumerate(deadlines):
+        repo.add_task(project, Task(title=f"t{i}", deadline=deadline, id=f"id-{i}",
+                                    created_at=T0 + timedelta(minutes=i // 2)))
+    return project
+
+
+def _expected(repo: InMemoryRepo, project: Project, sort: str):
+    field, descending = sort.lstrip("-"), sort.startswith("-")
+    tasks = repo.list_tasks_of_project(project.id)
+    present = sorted((t for t in tasks if getattr(t, field) is not None),
+                     key=lambda t: (getattr(t, field), t.id), reverse=descending)
+    missing = sorted((t.id for t in tasks if getattr(t, field) is None), reverse=descending)
+    return [t.id for t in present] + missing
+
+
+def _walk(repo: InMemoryRepo, project: Project, sort: str, limit: int):
+    ids, cursor = [], None
+    while True:
+        page = repo.list_tasks_page(project.id, limit=limit, cursor=cursor, sort=sort)
+        ids.extend(t.id for t in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("sort", ["created_at", "-created_at", "deadline", "-deadline"])
+@pytest.mark.parametrize("limit", [1, 2, 4, 10])
+def test_pages_cover_every_task_once_in_order(repo, sort, limit):
+    project = _seed(repo)
+    assert _walk(repo, project, sort, limit) == _expected(repo, project, sort)
+
+
+def test_tasks_without_deadline_come_last_in_both_directions(repo):
+    project = _seed(repo)
+    for sort in ("deadline", "-deadline"):
+        ids = _walk(repo, project, sort, 1)
+        assert [repo.get_task(i).deadline for i in ids[-2:]] == [None, None]
+
+
+def test_cursor_round_trip():
+    for value in (T0, D0, 0.5, None):
+        assert decode_cursor(encode_cursor(value, "x|y")) == (value, "x|y")
+
+
+def test_is_after_puts_none_last():
+    assert is_after((None, "a"), (D0, "z"))
+    assert is_after((None, "a"), (D0, "z"), descending=True)
+    assert not is_after((D0, "z"), (None, "a"))
+    assert is_after((None, "b"), (None, "a"))
+    assert is_after((None, "a"), (None, "b"), descending=True)
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "bm90LWEtY3Vyc29y", encode_cursor(D0, "x")[:-3]])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_task_cursor(cursor, "created_at")
+
+
+def test_cursor_of_another_sort_is_rejected():
+    with pytest.raises(ValueError):
+        decode_task_cursor(encode_cursor(D0, "x"), "created_at")
+    with pytest.raises(ValueError):
+        decode_task_cursor(encode_cursor(T0, "x"), "deadline")
+    with pytest.raises(ValueError):
+        decode_task_cursor(encode_cursor(None, "x"), "created_at")
+    assert decode_task_cursor(encode_cursor(None, "x"), "deadline") == (None, "x")
+
+
+def test_tampered_cursor_is_a_400(client, repo):
+    project = _seed(repo)
+    url = f"/projects/{project.id}/tasks"
+    first = client.get(url, params={"limit": 2, "sort": "deadline"}).json()
+    assert first["next_cursor"] is not None
+
+    r = client.get(url, params={"cursor": first["next_cursor"], "sort": "created_at"})
+    assert r.status_code == 400
+    r = client.get(url, params={"cursor": "garbage", "sort": "deadline"})
+    assert r.status_code == 400
+    r = client.get("/tasks", params={"cursor": encode_cursor(D0, "x"), "sort": "-created_at"})
+    assert r.status_code == 400
+
+
+def test_list_endpoint_pages_through_all_tasks(client, repo):
+    project = _seed(repo)
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 4, "sort": "-deadline"}
+        if cursor is not None:
+            params["cursor"] = cursor
+        body = client.get(f"/projects/{project.id}/tasks", params=params).json()
+        assert body["total"] == 6
+        ids.extend(t["id"] for t in body["tasks"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert ids == _expected(repo, project, "-deadline")
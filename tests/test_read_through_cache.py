@@ -0,0 +1,32 @@
+from todo_app.cache.backends import LRUCache
+from todo_app.cache.read_through import ReadThroughCache
+
+
+def test_value_loaded_before_invalidation_is_not_served_after_it():
+    cache = ReadThroughCache(LRUCache(100))
+    row = {"title": "old"}
+
+    def load():
+        loaded = dict(row)
+        # A writer commits and invalidates between our load and our set
+        row["title"] = "new"
+        cache.invalidate("p1")
+        return loaded
+
+    assert cache.get_or_load("p1", "task:t1", load) == {"title": "old"}
+    assert cache.get_object("p1", "task:t1") is None
+    assert cache.get_or_load("p1", "task:t1", lambda: dict(row)) == {"title": "new"}
+
+
+def test_set_with_generation_read_before_invalidation_is_unreachable():
+    cache = ReadThroughCache(LRUCache(100))
+    generation = cache.generation("p1")
+    cache.invalidate("p1")
+    cache.set("p1", "response:project:1", b"stale", generation=generation)
+    assert cache.get("p1", "response:project:1") is None
+
+
+def test_hit_does_not_call_loader():
+    cache = ReadThroughCache(LRUCache(100))
+    cache.get_or_load("p1", "project", lambda: {"name": "x"})
+    assert cache.get_or_load("p1", "project", lambda: 1 / 0) == {"name": "x"}
@@ -0,0 +1,25 @@
+from datetime import UTC, datetime
+
+from todo_app.models import Project, Task
+from todo_app.repositories.task_filter import TaskFilter
+
+
+def test_naive_created_bounds_are_taken_as_utc():
+    f = TaskFilter(created_from=datetime(2026, 1, 1), created_to=datetime(2026, 1, 2))
+    assert f.created_from == datetime(2026, 1, 1, tzinfo=UTC)
+    assert f.created_to == datetime(2026, 1, 2, tzinfo=UTC)
+    assert f.matches(Task(title="t")) is False  # compares without TypeError
+
+
+def test_naive_created_from_in_list_endpoint(client, repo):
+    project = Project(name="p")
+    repo.add_project(project)
+    repo.add_task(project, Task(title="t"))
+
+    r = client.get(f"/projects/{project.id}/tasks", params={"created_from": "2000-01-01T00:00:00"})
+    assert r.status_code == 200
+    assert [t["title"] for t in r.json()["tasks"]] == ["t"]
+
+    r = client.get("/tasks", params={"created_to": "2000-01-01T00:00:00"})
+    assert r.status_code == 200
+    assert r.json()["tasks"] == []
@@ -5,6 +5,16 @@ This module provides RESTful endpoints for managing projects and tasks,
 replacing the deprecated CLI interface.
 """
 
-from todo_app.api.main import app, create_app
+from typing import Any
 
-__all__ = ["app", "create_app"]
\ No newline at end of file
+__all__ = ["app", "create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the FastAPI app lazily, so importing e.g. todo_app.api.dependencies
+    # does not build the whole application.
+    if name in __all__:
+        from todo_app.api import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
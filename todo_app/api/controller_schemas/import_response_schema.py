@@ -0,0 +1,16 @@
+"""Response schema for the import endpoint."""
+
+from pydantic import BaseModel, Field
+
+
+class ImportResponse(BaseModel):
+    """Outcome of a bulk import."""
+
+    projects: int = Field(..., description="Projects created or updated")
+    tasks: int = Field(..., description="Tasks created or updated")
+    skipped: int = Field(..., description="Records that were not imported")
+    errors: list[str] = Field(
+        default_factory=list,
+        description="Why records were rejected (first errors only, with their line numbers)",
+        examples=[["line 3: Title must be ≤ 30 words."]],
+    )
@@ -17,4 +17,8 @@ class ProjectListResponse(BaseModel):
     """Schema for list of projects response."""
 
     projects: list[ProjectResponse]
-    total: int = Field(..., description="Total number of projects")
\ No newline at end of file
+    total: int = Field(..., description="Total number of projects")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (null when this is the last page)",
+    )
\ No newline at end of file
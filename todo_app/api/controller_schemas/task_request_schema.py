@@ -1,9 +1,9 @@
 """Request schemas for Task endpoints."""
 
-from datetime import date
+from datetime import date, datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 TaskStatusType = Literal["todo", "doing", "done"]
@@ -61,4 +61,44 @@ class TaskUpdateRequest(BaseModel):
 class TaskStatusUpdateRequest(BaseModel):
     """Schema for updating only task status."""
 
-    status: TaskStatusType = Field(..., description="New task status")
\ No newline at end of file
+    status: TaskStatusType = Field(..., description="New task status")
+
+
+class TaskBulkCreateRequest(BaseModel):
+    """Schema for creating many tasks in one request."""
+
+    tasks: list[TaskCreateRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10_000,
+        description="Tasks to create (at most 10000 per request)",
+    )
+
+
+class TaskFilterRequest(BaseModel):
+    """Criteria selecting tasks; all given criteria must match (ranges are inclusive)."""
+
+    status: list[TaskStatusType] | None = Field(default=None, description="Allowed statuses")
+    deadline_from: date | None = Field(default=None)
+    deadline_to: date | None = Field(default=None)
+    created_from: datetime | None = Field(default=None)
+    created_to: datetime | None = Field(default=None)
+
+
+class TaskBulkSelectRequest(BaseModel):
+    """Select tasks of a project by ids and/or a filter."""
+
+    task_ids: list[str] | None = Field(default=None, max_length=10_000)
+    filter: TaskFilterRequest | None = Field(default=None)
+
+    @model_validator(mode="after")
+    def ids_or_filter(self) -> "TaskBulkSelectRequest":
+        if self.task_ids is None and self.filter is None:
+            raise ValueError("Either task_ids or filter is required")
+        return self
+
+
+class TaskBulkStatusUpdateRequest(TaskBulkSelectRequest):
+    """Schema for changing the status of many tasks."""
+
+    status: TaskStatusType = Field(..., description="New task status")
@@ -25,4 +25,63 @@ class TaskListResponse(BaseModel):
     """Schema for list of tasks response."""
 
     tasks: list[TaskResponse]
-    total: int = Field(..., description="Total number of tasks")
\ No newline at end of file
+    total: int = Field(..., description="Total number of tasks")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (null when this is the last page)",
+    )
+
+
+class ProjectTaskResponse(TaskResponse):
+    """Schema for a task returned by a cross-project query."""
+
+    project_id: str = Field(..., examples=["550e8400-e29b-41d4-a716-446655440000"])
+
+
+class TaskQueryResponse(BaseModel):
+    """Schema for a page of tasks across projects."""
+
+    tasks: list[ProjectTaskResponse]
+    total: int = Field(..., description="Total number of matching tasks")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (null when this is the last page)",
+    )
+
+
+class TaskSearchHitResponse(ProjectTaskResponse):
+    """Schema for a full-text search hit."""
+
+    score: float = Field(..., description="Relevance score (higher is better)")
+
+
+class TaskSearchResponse(BaseModel):
+    """Schema for a page of search hits, best match first."""
+
+    hits: list[TaskSearchHitResponse]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (null when this is the last page)",
+    )
+
+
+class TaskBulkItemResult(BaseModel):
+    """Result of one item of a bulk create request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    task: TaskResponse | None = Field(default=None, description="Created task (on success)")
+    error: str | None = Field(default=None, description="Validation error (on failure)")
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for the bulk create response."""
+
+    results: list[TaskBulkItemResult]
+    created: int = Field(..., description="Number of tasks created")
+    failed: int = Field(..., description="Number of items rejected")
+
+
+class TaskBulkAffectedResponse(BaseModel):
+    """Schema for bulk status change / bulk delete responses."""
+
+    affected: int = Field(..., description="Number of tasks changed or deleted")
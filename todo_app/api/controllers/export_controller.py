@@ -0,0 +1,32 @@
+"""Data export endpoint."""
+
+from datetime import datetime, UTC
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from todo_app.commands.export import DEFAULT_BATCH_SIZE, stream_export
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="Export all projects and tasks as NDJSON",
+)
+def export_all(
+    batch_size: int = Query(
+        default=DEFAULT_BATCH_SIZE, ge=1, le=10_000, description="Rows fetched per round trip"
+    ),
+) -> StreamingResponse:
+    """
+    Stream every project, then every task, one JSON object per line.
+    Memory use is constant: rows are read through a server-side cursor as the body is sent.
+    """
+    filename = f"todo-export-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.ndjson"
+    return StreamingResponse(
+        stream_export(batch_size=batch_size),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,57 @@
+"""Bulk import endpoint."""
+
+from dataclasses import asdict
+from tempfile import SpooledTemporaryFile
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from todo_app.api.controller_schemas.import_response_schema import ImportResponse
+from todo_app.commands.import_data import DEFAULT_BATCH_SIZE, ImportFormat, import_stream
+from todo_app.scheduler.deadlines import get_deadline_index
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+# Request bodies larger than this are spooled to a temporary file
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _format_of(request: Request) -> ImportFormat:
+    content_type = request.headers.get("content-type", "")
+    return "csv" if content_type.startswith("text/csv") else "ndjson"
+
+
+@router.post(
+    "",
+    response_model=ImportResponse,
+    summary="Import projects and tasks from NDJSON or CSV",
+)
+async def import_data(
+    request: Request,
+    format: Literal["ndjson", "csv"] | None = Query(
+        default=None, description="Input format (default: from Content-Type, else ndjson)"
+    ),
+    batch_size: int = Query(
+        default=DEFAULT_BATCH_SIZE, ge=1, le=100_000, description="Rows sent per COPY"
+    ),
+) -> ImportResponse:
+    """
+    Import the request body (the format written by `GET /export`, or CSV with
+    the same fields). Invalid records are skipped and reported; the rest are
+    loaded in one transaction.
+    """
+    fmt = format or _format_of(request)
+    index = get_deadline_index()
+    with SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+        try:
+            result = await run_in_threadpool(
+                import_stream, body, fmt, batch_size=batch_size,
+                on_task_saved=None if index is None else index.track,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ImportResponse(**asdict(result))
@@ -1,6 +1,6 @@
 """Project API endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from todo_app.api.controller_schemas.project_request_schema import (
     ProjectCreateRequest,
@@ -10,7 +10,9 @@ from todo_app.api.controller_schemas.project_response_schema import (
     ProjectListResponse,
     ProjectResponse,
 )
-from todo_app.api.dependencies import ProjectServiceDep
+from todo_app.api.dependencies import ProjectServiceDep, ResponseCacheDep
+from todo_app.api.etag import is_not_modified, make_etag, not_modified
+from todo_app.api.responses import fast_json, project_dict
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -21,13 +23,13 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project",
 )
-def create_project(
+async def create_project(
     request: ProjectCreateRequest,
     service: ProjectServiceDep,
 ) -> ProjectResponse:
     """Create a new project with the given name and description."""
     try:
-        project = service.create_project(name=request.name, description=request.description)
+        project = await service.create_project(name=request.name, description=request.description)
         return ProjectResponse.model_validate(project)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -38,12 +40,31 @@ def create_project(
     response_model=ProjectListResponse,
     summary="List all projects",
 )
-def list_projects(service: ProjectServiceDep) -> ProjectListResponse:
-    """Retrieve all projects."""
-    projects = service.list_projects()
-    return ProjectListResponse(
-        projects=[ProjectResponse.model_validate(p) for p in projects],
-        total=len(projects),
+async def list_projects(
+    request: Request,
+    service: ProjectServiceDep,
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of projects to return"),
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous page"),
+) -> Response:
+    """
+    Retrieve projects ordered by creation time, one page at a time.
+    Honors If-None-Match: 304 when no project was added, changed or deleted.
+    """
+    etag = make_etag(await service.get_projects_version())
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    try:
+        # ProjectResponse does not expose tasks, so they are not loaded
+        page = await service.list_projects_page(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return fast_json(
+        {
+            "projects": [project_dict(p) for p in page.items],
+            "total": await service.count_projects(),
+            "next_cursor": page.next_cursor,
+        },
+        etag=etag,
     )
 
 
@@ -52,15 +73,44 @@ def list_projects(service: ProjectServiceDep) -> ProjectListResponse:
     response_model=ProjectResponse,
     summary="Get a project by ID",
 )
-def get_project(project_id: str, service: ProjectServiceDep) -> ProjectResponse:
-    """Retrieve a single project by its ID."""
-    project = service.get_project(project_id)
+async def get_project(
+    project_id: str,
+    request: Request,
+    response: Response,
+    service: ProjectServiceDep,
+    cache: ResponseCacheDep,
+) -> ProjectResponse | Response:
+    """Retrieve a single project by its ID (honors If-None-Match)."""
+    # The revision is read first, so the ETag is never newer than the body
+    revision = await service.get_project_revision(project_id)
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found",
+        )
+    etag = make_etag(revision)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cache_key = f"response:project:{revision}"
+    generation = None
+    if cache is not None:
+        generation = cache.generation(project_id)
+        body = cache.get(project_id, cache_key, generation=generation)
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    project = await service.get_project(project_id, include_tasks=False)
     if project is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found",
         )
-    return ProjectResponse.model_validate(project)
+    result = ProjectResponse.model_validate(project)
+    if cache is not None:
+        cache.set(project_id, cache_key, result.model_dump_json().encode(), generation=generation)
+    response.headers["ETag"] = etag
+    return result
 
 
 @router.put(
@@ -68,13 +118,13 @@ def get_project(project_id: str, service: ProjectServiceDep) -> ProjectResponse:
     response_model=ProjectResponse,
     summary="Update a project",
 )
-def update_project(
+async def update_project(
     project_id: str,
     request: ProjectUpdateRequest,
     service: ProjectServiceDep,
 ) -> ProjectResponse:
     """Update an existing project."""
-    project = service.get_project(project_id)
+    project = await service.get_project(project_id, include_tasks=False)
     if project is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -82,9 +132,10 @@ def update_project(
         )
 
     try:
-        new_name = request.name if request.name is not None else project.name
-        new_desc = request.description if request.description is not None else project.description
-        updated = service.edit_project(project_id, new_name=new_name, new_description=new_desc)
+        # Unset fields stay None, so only the fields sent are written
+        updated = await service.edit_project(
+            project_id, new_name=request.name, new_description=request.description
+        )
         return ProjectResponse.model_validate(updated)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -95,12 +146,12 @@ def update_project(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a project",
 )
-def delete_project(project_id: str, service: ProjectServiceDep) -> None:
+async def delete_project(project_id: str, service: ProjectServiceDep) -> None:
     """Delete a project and all its tasks."""
-    project = service.get_project(project_id)
+    project = await service.get_project(project_id, include_tasks=False)
     if project is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found",
         )
-    service.delete_project(project_id)
\ No newline at end of file
+    await service.delete_project(project_id)
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""Cross-project task query endpoints."""
+
+from datetime import date, datetime
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
+
+from todo_app.api.controller_schemas.task_request_schema import TaskStatusType
+from todo_app.api.controller_schemas.task_response_schema import (
+    TaskQueryResponse,
+    TaskSearchResponse,
+)
+from todo_app.api.dependencies import TaskServiceDep
+from todo_app.api.responses import fast_json, task_dict
+from todo_app.repositories import TaskFilter
+from todo_app.repositories.task_filter import TaskSort
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get(
+    "",
+    response_model=TaskQueryResponse,
+    summary="Query tasks across projects",
+)
+async def query_tasks(
+    service: TaskServiceDep,
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of tasks to return"),
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous page"),
+    project_id: list[str] | None = Query(
+        default=None, description="Only tasks of these projects (repeatable)"
+    ),
+    status_: list[TaskStatusType] | None = Query(
+        default=None, alias="status", description="Only tasks with one of these statuses"
+    ),
+    deadline_from: date | None = Query(default=None, description="Deadline on or after"),
+    deadline_to: date | None = Query(default=None, description="Deadline on or before"),
+    created_from: datetime | None = Query(default=None, description="Created on or after"),
+    created_to: datetime | None = Query(default=None, description="Created on or before"),
+    sort: TaskSort = Query(
+        default="created_at", description="Sort field; prefix with '-' for descending"
+    ),
+) -> Response:
+    """Retrieve tasks of all (or the selected) projects matching the filters, one page at a time."""
+    task_filter = TaskFilter(
+        statuses=tuple(status_) if status_ is not None else None,
+        due_from=deadline_from,
+        due_to=deadline_to,
+        created_from=created_from,
+        created_to=created_to,
+        project_ids=tuple(project_id) if project_id is not None else None,
+    )
+    try:
+        page = await service.query_tasks(task_filter, limit=limit, cursor=cursor, sort=sort)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return fast_json(
+        {
+            "tasks": [{**task_dict(t), "project_id": pid} for pid, t in page.items],
+            "total": await service.count_tasks(task_filter),
+            "next_cursor": page.next_cursor,
+        }
+    )
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    summary="Full-text search over task titles and descriptions",
+)
+async def search_tasks(
+    service: TaskServiceDep,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    limit: int = Query(default=20, ge=1, le=100, description="Maximum number of hits to return"),
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous page"),
+    project_id: list[str] | None = Query(
+        default=None, description="Only tasks of these projects (repeatable)"
+    ),
+    status_: list[TaskStatusType] | None = Query(
+        default=None, alias="status", description="Only tasks with one of these statuses"
+    ),
+) -> Response:
+    """Find tasks containing all the given words, best match first, one page at a time."""
+    task_filter = TaskFilter(
+        statuses=tuple(status_) if status_ is not None else None,
+        project_ids=tuple(project_id) if project_id is not None else None,
+    )
+    try:
+        page = await service.search_tasks(q, limit=limit, cursor=cursor, task_filter=task_filter)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return fast_json(
+        {
+            "hits": [
+                {**task_dict(h.task), "project_id": h.project_id, "score": h.score}
+                for h in page.items
+            ],
+            "next_cursor": page.next_cursor,
+        }
+    )
@@ -1,28 +1,54 @@
 """Task API endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
+from datetime import date, datetime
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from todo_app.api.controller_schemas.task_request_schema import (
+    TaskBulkCreateRequest,
+    TaskBulkSelectRequest,
+    TaskBulkStatusUpdateRequest,
     TaskCreateRequest,
+    TaskFilterRequest,
+    TaskStatusType,
     TaskStatusUpdateRequest,
     TaskUpdateRequest,
 )
 from todo_app.api.controller_schemas.task_response_schema import (
+    TaskBulkAffectedResponse,
+    TaskBulkCreateResponse,
+    TaskBulkItemResult,
     TaskListResponse,
     TaskResponse,
 )
-from todo_app.api.dependencies import TaskServiceDep
+from todo_app.api.dependencies import ResponseCacheDep, TaskServiceDep
+from todo_app.api.etag import is_not_modified, make_etag, not_modified
+from todo_app.api.responses import fast_json, task_dict
+from todo_app.repositories import TaskFilter
+from todo_app.repositories.task_filter import TaskSort
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["Tasks"])
 
 
+def _to_task_filter(f: TaskFilterRequest | None) -> TaskFilter | None:
+    if f is None:
+        return None
+    return TaskFilter(
+        statuses=tuple(f.status) if f.status is not None else None,
+        due_from=f.deadline_from,
+        due_to=f.deadline_to,
+        created_from=f.created_from,
+        created_to=f.created_to,
+    )
+
+
 @router.post(
     "",
     response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
 )
-def create_task(
+async def create_task(
     project_id: str,
     request: TaskCreateRequest,
     service: TaskServiceDep,
@@ -31,7 +57,7 @@ def create_task(
     try:
         # Convert date to string for service
         deadline_str = request.deadline.isoformat() if request.deadline else None
-        task = service.add_task(
+        task = await service.add_task(
             project_id=project_id,
             title=request.title,
             description=request.description,
@@ -43,21 +69,146 @@ def create_task(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    ":bulk",
+    response_model=TaskBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many tasks at once",
+)
+async def create_tasks_bulk(
+    project_id: str,
+    request: TaskBulkCreateRequest,
+    service: TaskServiceDep,
+) -> TaskBulkCreateResponse:
+    """Create many tasks within a project in one transaction, with a result per item."""
+    items = [
+        {
+            "title": t.title,
+            "description": t.description,
+            "status": t.status,
+            "deadline_str": t.deadline.isoformat() if t.deadline else None,
+        }
+        for t in request.tasks
+    ]
+    try:
+        results = await service.add_tasks(project_id=project_id, items=items)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    created = sum(1 for r in results if r.task is not None)
+    return TaskBulkCreateResponse(
+        results=[
+            TaskBulkItemResult(
+                index=r.index,
+                task=TaskResponse.model_validate(r.task) if r.task is not None else None,
+                error=r.error,
+            )
+            for r in results
+        ],
+        created=created,
+        failed=len(results) - created,
+    )
+
+
+@router.patch(
+    ":bulk-status",
+    response_model=TaskBulkAffectedResponse,
+    summary="Update the status of many tasks",
+)
+async def update_tasks_status_bulk(
+    project_id: str,
+    request: TaskBulkStatusUpdateRequest,
+    service: TaskServiceDep,
+) -> TaskBulkAffectedResponse:
+    """Change the status of the tasks selected by ids and/or filter in one statement."""
+    try:
+        affected = await service.change_status_many(
+            project_id,
+            request.status,
+            task_ids=request.task_ids,
+            task_filter=_to_task_filter(request.filter),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskBulkAffectedResponse(affected=affected)
+
+
+@router.post(
+    ":bulk-delete",
+    response_model=TaskBulkAffectedResponse,
+    summary="Delete many tasks",
+)
+async def delete_tasks_bulk(
+    project_id: str,
+    request: TaskBulkSelectRequest,
+    service: TaskServiceDep,
+) -> TaskBulkAffectedResponse:
+    """Delete the tasks selected by ids and/or filter in one statement."""
+    try:
+        affected = await service.delete_tasks(
+            project_id,
+            task_ids=request.task_ids,
+            task_filter=_to_task_filter(request.filter),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskBulkAffectedResponse(affected=affected)
+
+
 @router.get(
     "",
     response_model=TaskListResponse,
     summary="List all tasks in a project",
 )
-def list_tasks(project_id: str, service: TaskServiceDep) -> TaskListResponse:
-    """Retrieve all tasks for a specific project."""
+async def list_tasks(
+    project_id: str,
+    request: Request,
+    service: TaskServiceDep,
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of tasks to return"),
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous page"),
+    status_: list[TaskStatusType] | None = Query(
+        default=None, alias="status", description="Only tasks with one of these statuses"
+    ),
+    deadline_from: date | None = Query(default=None, description="Deadline on or after"),
+    deadline_to: date | None = Query(default=None, description="Deadline on or before"),
+    created_from: datetime | None = Query(default=None, description="Created on or after"),
+    created_to: datetime | None = Query(default=None, description="Created on or before"),
+    sort: TaskSort = Query(
+        default="created_at", description="Sort field; prefix with '-' for descending"
+    ),
+) -> Response:
+    """
+    Retrieve tasks of a specific project, filtered and sorted server-side, one page at a time.
+    Honors If-None-Match: 304 while the project and its tasks are unchanged.
+    """
+    revision = await service.get_project_revision(project_id)
+    etag = make_etag(revision) if revision is not None else None
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified(etag)
+
+    task_filter = _to_task_filter(
+        TaskFilterRequest(
+            status=status_,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    )
     try:
-        tasks = service.list_tasks_of_project(project_id)
-        return TaskListResponse(
-            tasks=[TaskResponse.model_validate(t) for t in tasks],
-            total=len(tasks),
+        page = await service.list_tasks_page(
+            project_id, limit=limit, cursor=cursor, task_filter=task_filter, sort=sort
         )
     except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return fast_json(
+        {
+            "tasks": [task_dict(t) for t in page.items],
+            "total": await service.count_tasks_of_project(project_id, task_filter),
+            "next_cursor": page.next_cursor,
+        },
+        etag=etag,
+    )
 
 
 @router.get(
@@ -65,17 +216,45 @@ def list_tasks(project_id: str, service: TaskServiceDep) -> TaskListResponse:
     response_model=TaskResponse,
     summary="Get a task by ID",
 )
-def get_task(project_id: str, task_id: str, service: TaskServiceDep) -> TaskResponse:
-    """Retrieve a single task by its ID."""
-    # Find task in the project's tasks
-    tasks = service.list_tasks_of_project(project_id)
-    task = next((t for t in tasks if t.id == task_id), None)
+async def get_task(
+    project_id: str,
+    task_id: str,
+    request: Request,
+    response: Response,
+    service: TaskServiceDep,
+    cache: ResponseCacheDep,
+) -> TaskResponse | Response:
+    """Retrieve a single task by its ID (honors If-None-Match)."""
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Task with id {task_id} not found in project {project_id}",
+    )
+    # The revision is read first, so the ETag is never newer than the body
+    revision = await service.get_project_revision(project_id)
+    if revision is None:
+        raise not_found
+    etag = make_etag(revision)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cache_key = f"response:task:{task_id}:{revision}"
+    generation = None
+    if cache is not None:
+        # Token taken before loading, so a body loaded before an invalidation
+        # is not stored under the token that comes after it
+        generation = cache.generation(project_id)
+        body = cache.get(project_id, cache_key, generation=generation)
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    task = await service.get_task(project_id, task_id)
     if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found in project {project_id}",
-        )
-    return TaskResponse.model_validate(task)
+        raise not_found
+    result = TaskResponse.model_validate(task)
+    if cache is not None:
+        cache.set(project_id, cache_key, result.model_dump_json().encode(), generation=generation)
+    response.headers["ETag"] = etag
+    return result
 
 
 @router.put(
@@ -83,16 +262,14 @@ def get_task(project_id: str, task_id: str, service: TaskServiceDep) -> TaskResp
     response_model=TaskResponse,
     summary="Update a task",
 )
-def update_task(
+async def update_task(
     project_id: str,
     task_id: str,
     request: TaskUpdateRequest,
     service: TaskServiceDep,
 ) -> TaskResponse:
     """Update an existing task."""
-    # First check if task exists
-    tasks = service.list_tasks_of_project(project_id)
-    task = next((t for t in tasks if t.id == task_id), None)
+    task = await service.get_task(project_id, task_id)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -101,7 +278,7 @@ def update_task(
 
     try:
         deadline_str = request.deadline.isoformat() if request.deadline else None
-        updated = service.edit_task(
+        updated = await service.edit_task(
             task_id,
             title=request.title if request.title is not None else None,
             description=request.description if request.description is not None else None,
@@ -118,16 +295,14 @@ def update_task(
     response_model=TaskResponse,
     summary="Update task status",
 )
-def update_task_status(
+async def update_task_status(
     project_id: str,
     task_id: str,
     request: TaskStatusUpdateRequest,
     service: TaskServiceDep,
 ) -> TaskResponse:
     """Update only the status of a task."""
-    # First check if task exists
-    tasks = service.list_tasks_of_project(project_id)
-    task = next((t for t in tasks if t.id == task_id), None)
+    task = await service.get_task(project_id, task_id)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -135,7 +310,7 @@ def update_task_status(
         )
 
     try:
-        updated = service.change_status(task_id, request.status)
+        updated = await service.change_status(task_id, request.status)
         return TaskResponse.model_validate(updated)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -146,14 +321,12 @@ def update_task_status(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a task",
 )
-def delete_task(project_id: str, task_id: str, service: TaskServiceDep) -> None:
+async def delete_task(project_id: str, task_id: str, service: TaskServiceDep) -> None:
     """Delete a task from a project."""
-    # First check if task exists
-    tasks = service.list_tasks_of_project(project_id)
-    task = next((t for t in tasks if t.id == task_id), None)
+    task = await service.get_task(project_id, task_id)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found in project {project_id}",
         )
-    service.delete_task(task_id)
\ No newline at end of file
+    await service.delete_task(task_id)
\ No newline at end of file
@@ -1,40 +1,128 @@
 """Dependency injection for FastAPI routes."""
 
-from collections.abc import Generator
-from typing import Annotated
+from collections.abc import AsyncGenerator, Generator
+from datetime import date
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Optional
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from todo_app.db.session import SessionLocal
-from todo_app.repositories import SqlAlchemyProjectRepository, SqlAlchemyTaskRepository
-from todo_app.services import ProjectService, TaskService
+from todo_app.cache import ReadThroughCache, get_cache
+from todo_app.config import settings
+from todo_app.db.session import SessionLocal, get_async_sessionmaker
+from todo_app.db.unit_of_work import after_commit, unit_of_work
+from todo_app.repositories import (
+    CachedProjectRepository,
+    CachedTaskRepository,
+    ProjectRepository,
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    TaskRepository,
+)
+from todo_app.models import TaskStatus
+from todo_app.scheduler.deadlines import get_deadline_index
+from todo_app.services import AsyncService, ProjectService, TaskSavedListener, TaskService
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Yield a database session and ensure it is closed after use."""
-    db = SessionLocal()
-    try:
+    """
+    Yield the request's database session (its unit of work): committed once
+    after the route returns, rolled back if it raised, then closed.
+    """
+    with SessionLocal() as db, unit_of_work(db):
         yield db
-    finally:
-        db.close()
 
 
-DBSession = Annotated[Session, Depends(get_db)]
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """Async counterpart of get_db (asyncpg)."""
+    async with get_async_sessionmaker()() as db:
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        await db.commit()
+
+
+# scope="function": the commit happens before the response is sent, so a
+# failed commit is reported to the client instead of being lost
+DBSession = Annotated[Session, Depends(get_db, scope="function")]
 
+# Read-through cache (None when CACHE_BACKEND=none); controllers use it for serialized responses
+ResponseCacheDep = Annotated[Optional[ReadThroughCache], Depends(get_cache)]
 
-def get_project_service(db: DBSession) -> ProjectService:
-    """Create and return a ProjectService instance."""
+
+def _project_repo(db: Session) -> ProjectRepository:
     repo = SqlAlchemyProjectRepository(db)
-    return ProjectService(repo)
+    cache = get_cache()
+    if cache is None:
+        return repo
+    return CachedProjectRepository(repo, cache, after_commit=partial(after_commit, db))
+
+
+def _task_repo(db: Session) -> TaskRepository:
+    repo = SqlAlchemyTaskRepository(db)
+    cache = get_cache()
+    if cache is None:
+        return repo
+    return CachedTaskRepository(
+        repo,
+        cache,
+        revision_of=SqlAlchemyProjectRepository(db).get_project_revision,
+        after_commit=partial(after_commit, db),
+    )
+
+
+def _project_service(db: Session) -> ProjectService:
+    return ProjectService(_project_repo(db))
+
+
+def _deadline_listener(db: Session) -> Optional[TaskSavedListener]:
+    """Report saved tasks to the deadline timer index once the request commits."""
+    index = get_deadline_index()
+    if index is None:
+        return None
+
+    def on_task_saved(task_id: str, deadline: Optional[date], status: TaskStatus) -> None:
+        after_commit(db, partial(index.track, task_id, deadline, status))
+
+    return on_task_saved
+
+
+def _task_service(db: Session) -> TaskService:
+    return TaskService(_project_repo(db), _task_repo(db), on_task_saved=_deadline_listener(db))
+
+
+# Controllers are `async def` and always await service calls. DB_ASYNC selects
+# whether those calls run over an AsyncSession on the event loop or over a
+# regular Session in the threadpool.
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    AsyncDBSession = Annotated[AsyncSession, Depends(get_async_db, scope="function")]
+
+    def get_project_service(db: AsyncDBSession) -> AsyncService[ProjectService]:
+        """Create and return a ProjectService running over an AsyncSession."""
+        return AsyncService.over_async_session(db, _project_service)
+
+    def get_task_service(db: AsyncDBSession) -> AsyncService[TaskService]:
+        """Create and return a TaskService running over an AsyncSession."""
+        return AsyncService.over_async_session(db, _task_service)
+
+else:
 
+    def get_project_service(db: DBSession) -> AsyncService[ProjectService]:
+        """Create and return a ProjectService instance."""
+        return AsyncService.in_threadpool(_project_service(db))
 
-def get_task_service(db: DBSession) -> TaskService:
-    """Create and return a TaskService instance."""
-    project_repo = SqlAlchemyProjectRepository(db)
-    task_repo = SqlAlchemyTaskRepository(db)
-    return TaskService(project_repo, task_repo)
+    def get_task_service(db: DBSession) -> AsyncService[TaskService]:
+        """Create and return a TaskService instance."""
+        return AsyncService.in_threadpool(_task_service(db))
 
 
-ProjectServiceDep = Annotated[ProjectService, Depends(get_project_service)]
-TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
\ No newline at end of file
+ProjectServiceDep = Annotated[AsyncService[ProjectService], Depends(get_project_service)]
+TaskServiceDep = Annotated[AsyncService[TaskService], Depends(get_task_service)]
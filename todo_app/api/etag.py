@@ -0,0 +1,27 @@
+"""Helpers for ETag / If-None-Match (conditional GET) handling."""
+
+from fastapi import Request, Response, status
+
+
+def make_etag(version: object) -> str:
+    """Weak ETag for a resource version (same version -> same ETag)."""
+    return f'W/"{version}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag) for tag in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -1,9 +1,26 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from todo_app.api.router import api_router
+from todo_app.db.session import get_pool_status
+from todo_app.scheduler.deadlines import start_deadline_timer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the deadline timer (AUTOCLOSE_TIMER) for as long as the worker runs."""
+    timer = await run_in_threadpool(start_deadline_timer)
+    try:
+        yield
+    finally:
+        if timer is not None:
+            timer.stop(timeout=5)
 
 
 def create_app() -> FastAPI:
@@ -14,6 +31,7 @@ def create_app() -> FastAPI:
         version="3.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Health check endpoint
@@ -22,6 +40,11 @@ def create_app() -> FastAPI:
         """Check API health status."""
         return {"status": "ok", "message": "ToDo List API is running"}
 
+    @app.get("/health/db-pool", tags=["Health"])
+    def db_pool_status() -> dict[str, int | float]:
+        """Report connection pool usage and checkout wait times of this worker."""
+        return get_pool_status()
+
     # Include API routes
     app.include_router(api_router)
 
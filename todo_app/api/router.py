@@ -2,9 +2,18 @@
 
 from fastapi import APIRouter
 
-from todo_app.api.controllers import projects_controller, tasks_controller
+from todo_app.api.controllers import (
+    export_controller,
+    import_controller,
+    projects_controller,
+    task_queries_controller,
+    tasks_controller,
+)
 
 api_router = APIRouter()
 
 api_router.include_router(projects_controller.router)
-api_router.include_router(tasks_controller.router)
\ No newline at end of file
+api_router.include_router(tasks_controller.router)
+api_router.include_router(task_queries_controller.router)
+api_router.include_router(export_controller.router)
+api_router.include_router(import_controller.router)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from .backends import CacheBackend, LRUCache, RedisCache
+from .read_through import ReadThroughCache, get_cache
+
+__all__ = [
+    "CacheBackend",
+    "LRUCache",
+    "RedisCache",
+    "ReadThroughCache",
+    "get_cache",
+]
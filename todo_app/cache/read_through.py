@@ -0,0 +1,119 @@
+"""
+Project-scoped read-through cache.
+
+Every entry belongs to a project and is stored under that project's current
+generation token: `<project_id>:<token>:<key>`. Invalidating a project drops
+its token, so all of its entries (domain objects, serialized responses, for
+any query parameters) become unreachable at once and age out of the backend.
+
+A read-through takes the token once, before loading, and stores what it loaded
+under that same token (get_or_load, or the `generation` argument of get/set).
+Invalidation runs after the writer commits, so a reader that loaded stale data
+before it took the token from before the invalidation: the entry goes under the
+old token, where nobody will look for it. Re-reading the token at write time
+would file that stale data under the new one.
+"""
+
+from __future__ import annotations
+
+import pickle
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from todo_app.cache.backends import CacheBackend, LRUCache, RedisCache
+from todo_app.config import get_settings
+
+
+class ReadThroughCache:
+    def __init__(self, backend: CacheBackend, *, ttl_seconds: Optional[float] = None) -> None:
+        self._backend = backend
+        self._ttl = ttl_seconds
+
+    # -------- Generations --------
+    def generation(self, project_id: str) -> str:
+        """Current token of a project (created on first use)."""
+        key = f"gen:{project_id}"
+        token = self._backend.get(key)
+        if token is None:
+            token = uuid4().hex.encode()
+            self._backend.set(key, token, self._ttl)
+        return token.decode()
+
+    def _key(self, project_id: str, key: str, generation: Optional[str]) -> str:
+        if generation is None:
+            generation = self.generation(project_id)
+        return f"{project_id}:{generation}:{key}"
+
+    def invalidate(self, project_id: str) -> None:
+        """Drop every entry of a project."""
+        self._backend.delete(f"gen:{project_id}")
+
+    # -------- Raw (serialized responses) --------
+    def get(self, project_id: str, key: str, *,
+            generation: Optional[str] = None) -> Optional[bytes]:
+        return self._backend.get(self._key(project_id, key, generation))
+
+    def set(self, project_id: str, key: str, value: bytes, *,
+            generation: Optional[str] = None) -> None:
+        """Store value; pass the generation read before the value was loaded."""
+        self._backend.set(self._key(project_id, key, generation), value, self._ttl)
+
+    # -------- Domain objects --------
+    def get_object(self, project_id: str, key: str, *, generation: Optional[str] = None) -> Any:
+        """
+        Cached object, or None (None itself is never cached). Objects are
+        pickled, so every hit is a fresh copy that callers may mutate freely.
+        """
+        raw = self.get(project_id, key, generation=generation)
+        return None if raw is None else pickle.loads(raw)
+
+    def set_object(self, project_id: str, key: str, value: Any, *,
+                   generation: Optional[str] = None) -> None:
+        self.set(project_id, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                 generation=generation)
+
+    def get_or_load(self, project_id: str, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Cached object, or the result of load() (cached unless None). The
+        token is read once, before load(), and used for both get and set.
+        """
+        generation = self.generation(project_id)
+        value = self.get_object(project_id, key, generation=generation)
+        if value is None:
+            value = load()
+            if value is not None:
+                self.set_object(project_id, key, value, generation=generation)
+        return value
+
+    # -------- Task -> project mapping (tasks never move between projects) --------
+    def remember_task(self, task_id: str, project_id: str) -> None:
+        self._backend.set(f"task:{task_id}", project_id.encode(), self._ttl)
+
+    def project_of_task(self, task_id: str) -> Optional[str]:
+        raw = self._backend.get(f"task:{task_id}")
+        return raw.decode() if raw is not None else None
+
+    def forget_task(self, task_id: str) -> None:
+        self._backend.delete(f"task:{task_id}")
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Optional[ReadThroughCache]:
+    """
+    The process-wide cache selected by CACHE_BACKEND (none | memory | redis),
+    or None when caching is disabled.
+    """
+    settings = get_settings()
+    backend_name = settings.CACHE_BACKEND.strip().lower()
+    if backend_name in ("", "none"):
+        return None
+    ttl = settings.CACHE_TTL_SECONDS if settings.CACHE_TTL_SECONDS > 0 else None
+    backend: CacheBackend
+    if backend_name == "memory":
+        backend = LRUCache(settings.CACHE_MAX_ENTRIES)
+    elif backend_name == "redis":
+        backend = RedisCache.from_url(settings.CACHE_URL)
+    else:
+        raise ValueError(f"Invalid CACHE_BACKEND: {settings.CACHE_BACKEND!r}")
+    return ReadThroughCache(backend, ttl_seconds=ttl)
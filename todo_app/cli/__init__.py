@@ -12,4 +12,15 @@ CLI module for ToDoList application.
         http://localhost:8000/docs
 """
 
-from .console import run_cli
\ No newline at end of file
+from typing import Any
+
+__all__ = ["run_cli"]
+
+
+def __getattr__(name: str) -> Any:
+    # The console pulls in services, repositories and the DB layer; load it on use
+    if name == "run_cli":
+        from .console import run_cli
+
+        return run_cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
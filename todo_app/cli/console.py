@@ -24,6 +24,7 @@ from todo_app.repositories import (
     SqlAlchemyTaskRepository,
 )
 from todo_app.db.session import SessionLocal
+from todo_app.db.unit_of_work import unit_of_work
 
 
 # ---------- Helpers (generic I/O) ----------
@@ -43,7 +44,7 @@ def confirm(msg: str = "Are you sure? (Y/n): ") -> bool:
 
 def choose_project(ps: ProjectService) -> Optional[str]:
     """Let the user choose a project and return its id."""
-    projects = ps.list_projects()
+    projects = ps.list_projects(include_tasks=False)
     if not projects:
         print("No projects found.")
         return None
@@ -117,11 +118,8 @@ def ask_deadline() -> Optional[str]:
 def action_create_project(ps: ProjectService) -> None:
     name = prompt("Project name: ")
     desc = prompt("Project description: ")
-    try:
-        p = ps.create_project(name=name, description=desc)
-        print(f"Project created: {p.name} ({p.id})")
-    except Exception as e:
-        print(f"Error: {e}")
+    p = ps.create_project(name=name, description=desc)
+    print(f"Project created: {p.name} ({p.id})")
 
 
 def action_edit_project(ps: ProjectService) -> None:
@@ -130,11 +128,8 @@ def action_edit_project(ps: ProjectService) -> None:
         return
     new_name = prompt("New name (blank to skip): ")
     new_desc = prompt("New description (blank to skip): ")
-    try:
-        p = ps.edit_project(pid, new_name=new_name or None, new_description=new_desc or None)
-        print(f"Project updated: {p.name} ({p.id})")
-    except Exception as e:
-        print(f"Error: {e}")
+    p = ps.edit_project(pid, new_name=new_name or None, new_description=new_desc or None)
+    print(f"Project updated: {p.name} ({p.id})")
 
 
 def action_delete_project(ps: ProjectService) -> None:
@@ -144,11 +139,8 @@ def action_delete_project(ps: ProjectService) -> None:
     if not confirm("Delete this project and cascade tasks? (Y/n): "):
         print("Cancelled.")
         return
-    try:
-        ps.delete_project(pid)
-        print("Project deleted (cascaded tasks removed).")
-    except Exception as e:
-        print(f"Error: {e}")
+    ps.delete_project(pid)
+    print("Project deleted (cascaded tasks removed).")
 
 
 def action_list_projects(ps: ProjectService) -> None:
@@ -173,11 +165,8 @@ def action_add_task(ps: ProjectService, ts: TaskService) -> None:
         return
     deadline = ask_deadline()
 
-    try:
-        t = ts.add_task(project_id=pid, title=title, description=desc, status=status, deadline_str=deadline)
-        print(f"Task created: {t.title} ({t.id})")
-    except Exception as e:
-        print(f"Error: {e}")
+    t = ts.add_task(project_id=pid, title=title, description=desc, status=status, deadline_str=deadline)
+    print(f"Task created: {t.title} ({t.id})")
 
 
 def action_edit_task(ps: ProjectService, ts: TaskService) -> None:
@@ -194,17 +183,14 @@ def action_edit_task(ps: ProjectService, ts: TaskService) -> None:
     new_status = raw_status or None
     new_deadline = prompt("New deadline YYYY-MM-DD (blank to skip): ").strip() or None
 
-    try:
-        t2 = ts.edit_task(
-            tid,
-            title=(new_title or None),
-            description=(new_desc or None),
-            status=new_status,
-            deadline_str=new_deadline,
-        )
-        print(f"Task updated: {t2.title} ({t2.id}) [{t2.status}] deadline={t2.deadline}")
-    except Exception as e:
-        print(f"Error: {e}")
+    t2 = ts.edit_task(
+        tid,
+        title=(new_title or None),
+        description=(new_desc or None),
+        status=new_status,
+        deadline_str=new_deadline,
+    )
+    print(f"Task updated: {t2.title} ({t2.id}) [{t2.status}] deadline={t2.deadline}")
 
 
 def action_change_task_status(ps: ProjectService, ts: TaskService) -> None:
@@ -218,11 +204,8 @@ def action_change_task_status(ps: ProjectService, ts: TaskService) -> None:
     if new_status is None:
         print("Cancelled.")
         return
-    try:
-        t2 = ts.change_status(tid, new_status)
-        print(f"Status updated: {t2.title} -> {t2.status}")
-    except Exception as e:
-        print(f"Error: {e}")
+    t2 = ts.change_status(tid, new_status)
+    print(f"Status updated: {t2.title} -> {t2.status}")
 
 
 def action_delete_task(ps: ProjectService, ts: TaskService) -> None:
@@ -235,11 +218,8 @@ def action_delete_task(ps: ProjectService, ts: TaskService) -> None:
     if not confirm("Delete this task? (Y/n): "):
         print("Cancelled.")
         return
-    try:
-        ts.delete_task(tid)
-        print("Task deleted.")
-    except Exception as e:
-        print(f"Error: {e}")
+    ts.delete_task(tid)
+    print("Task deleted.")
 
 
 def action_list_tasks_of_project(ps: ProjectService, ts: TaskService) -> None:
@@ -315,6 +295,12 @@ def run_cli() -> None:
                 print("Invalid option. Try again.")
                 continue
 
-            action()
+            # Each action is one unit of work: committed when it completes, rolled
+            # back when it (or the commit) fails, so the session stays usable
+            try:
+                with unit_of_work(session):
+                    action()
+            except Exception as e:
+                print(f"Error: {e}")
     finally:
         session.close()
\ No newline at end of file
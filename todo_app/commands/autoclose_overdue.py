@@ -1,47 +1,278 @@
 from __future__ import annotations
 
-from datetime import date, datetime, UTC
+import argparse
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, UTC
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
 
+from todo_app.cache import get_cache
+from todo_app.config import get_settings
 from todo_app.db.session import SessionLocal
-from todo_app.db.models import TaskORM, TaskStatusEnum
+from todo_app.db.unit_of_work import after_commit, unit_of_work
+from todo_app.db.models import JobStateORM, TaskORM, TaskStatusEnum
+from todo_app.repositories.task_repository import touch_projects
 
+# job_state row holding the high-water mark of autoclose_incremental
+AUTOCLOSE_JOB = "autoclose_overdue"
 
-def autoclose_overdue_tasks() -> int:
+
+def _overdue_conditions(today: date) -> tuple:
+    """WHERE clauses selecting tasks with deadline < today and status != done."""
+    return (
+        TaskORM.deadline.is_not(None),
+        TaskORM.deadline < today,
+        TaskORM.status != TaskStatusEnum.DONE,
+    )
+
+
+def _touch(session: Session, project_ids: Iterable[str]) -> None:
+    """Bump the revisions of the projects and drop their cached reads once committed."""
+    project_ids = set(project_ids)
+    touch_projects(session, project_ids)
+    cache = get_cache()
+    if cache is None or not project_ids:
+        return
+
+    def invalidate() -> None:
+        for project_id in project_ids:
+            cache.invalidate(project_id)
+
+    after_commit(session, invalidate)
+
+
+def _iter_closed_batches(
+    session: Session,
+    *,
+    today: date,
+    now: datetime,
+    batch_size: Optional[int] = None,
+) -> Iterator[List[str]]:
+    """
+    Close overdue tasks with set-based UPDATE ... RETURNING statements
+    and yield the ids closed by each statement. The projects of those tasks
+    get their revision bumped in the same transaction, and their cached
+    reads invalidated after it commits.
+
+    Without batch_size a single UPDATE closes everything. With a batch size,
+    tasks are closed in chunks walking the primary key (keyset by id), and
+    each chunk is committed on its own so memory and transaction size stay bounded.
+    """
+    values = {"status": TaskStatusEnum.DONE, "closed_at": now}
+    options = {"synchronize_session": False}
+
+    if not batch_size or batch_size <= 0:
+        stmt = (
+            update(TaskORM)
+            .where(*_overdue_conditions(today))
+            .values(**values)
+            .returning(TaskORM.id, TaskORM.project_id)
+            .execution_options(**options)
+        )
+        rows = session.execute(stmt).all()
+        _touch(session, (project_id for _, project_id in rows))
+        session.commit()
+        yield [task_id for task_id, _ in rows]
+        return
+
+    last_id = ""
+    while True:
+        chunk = (
+            select(TaskORM.id)
+            .where(*_overdue_conditions(today), TaskORM.id > last_id)
+            .order_by(TaskORM.id)
+            .limit(batch_size)
+        )
+        stmt = (
+            update(TaskORM)
+            .where(TaskORM.id.in_(chunk.scalar_subquery()))
+            .values(**values)
+            .returning(TaskORM.id, TaskORM.project_id)
+            .execution_options(**options)
+        )
+        rows = session.execute(stmt).all()
+        _touch(session, (project_id for _, project_id in rows))
+        session.commit()
+        ids = [task_id for task_id, _ in rows]
+        if not ids:
+            return
+        yield ids
+        if len(ids) < batch_size:
+            return
+        last_id = max(ids)
+
+
+def iter_open_deadlines(session: Session, *, batch_size: int = 10_000) -> Iterator[Tuple[str, date]]:
+    """
+    (id, deadline) of every open task with a deadline, streamed from the
+    partial index ix_tasks_open_deadline (used to build the deadline timer index).
+    """
+    stmt = (
+        select(TaskORM.id, TaskORM.deadline)
+        .where(TaskORM.deadline.is_not(None), TaskORM.status != TaskStatusEnum.DONE)
+        .execution_options(yield_per=batch_size)
+    )
+    for task_id, deadline in session.execute(stmt):
+        yield task_id, deadline
+
+
+def close_overdue_tasks_by_id(task_ids: Sequence[str], *, batch_size: int = 1000) -> int:
+    """
+    Close the given tasks, if they are still open and overdue (the predicate is
+    re-checked, so ids that were edited, closed or deleted meanwhile are skipped).
+    Used by the deadline timer; returns the number of tasks closed.
+    """
+    today, now = date.today(), datetime.now(UTC)
+    closed = 0
+    with SessionLocal() as session, unit_of_work(session):
+        for start in range(0, len(task_ids), batch_size):
+            stmt = (
+                update(TaskORM)
+                .where(TaskORM.id.in_(task_ids[start:start + batch_size]), *_overdue_conditions(today))
+                .values(status=TaskStatusEnum.DONE, closed_at=now)
+                .returning(TaskORM.id, TaskORM.project_id)
+                .execution_options(synchronize_session=False)
+            )
+            rows = session.execute(stmt).all()
+            _touch(session, (project_id for _, project_id in rows))
+            closed += len(rows)
+    return closed
+
+
+def autoclose_overdue_task_ids(*, batch_size: Optional[int] = None) -> List[str]:
+    """
+    Same as autoclose_overdue_tasks, but returns the ids of the closed tasks.
+    """
+    if batch_size is None:
+        batch_size = get_settings().AUTOCLOSE_BATCH_SIZE
+
+    with SessionLocal() as session:
+        closed: List[str] = []
+        for ids in _iter_closed_batches(
+            session,
+            today=date.today(),
+            now=datetime.now(UTC),
+            batch_size=batch_size,
+        ):
+            closed.extend(ids)
+        return closed
+
+
+def autoclose_overdue_tasks(*, batch_size: Optional[int] = None) -> int:
     """
     Find all tasks with deadline < today and status != done,
     mark them as done and set closed_at to now.
 
+    The update runs in the database (no ORM objects are loaded). If batch_size
+    is given (or AUTOCLOSE_BATCH_SIZE is set) tasks are closed in chunks of that size.
+
     Returns the number of tasks that were updated.
     """
-    today = date.today()
-    now = datetime.now(UTC)
+    if batch_size is None:
+        batch_size = get_settings().AUTOCLOSE_BATCH_SIZE
 
     with SessionLocal() as session:
-        # Query all overdue tasks
-        stmt = select(TaskORM).where(
-            TaskORM.deadline.is_not(None),
-            TaskORM.deadline < today,
-            TaskORM.status != TaskStatusEnum.DONE,
+        return sum(
+            len(ids)
+            for ids in _iter_closed_batches(
+                session,
+                today=date.today(),
+                now=datetime.now(UTC),
+                batch_size=batch_size,
+            )
         )
-        tasks = session.scalars(stmt).all()
 
-        for t in tasks:
-            t.status = TaskStatusEnum.DONE
-            t.closed_at = now
 
-        session.commit()
-        return len(tasks)
+def _lock_job_state(session: Session, name: str) -> JobStateORM:
+    """The job's state row, locked until the end of the transaction (created if missing)."""
+    state = session.get(JobStateORM, name, with_for_update=True)
+    if state is None:
+        state = JobStateORM(name=name, last_processed_date=None)
+        session.add(state)
+        session.flush()
+    return state
+
+
+def _close_window(session: Session, *, since: date, until: date, now: datetime) -> int:
+    """Close open tasks with since <= deadline < until; returns how many were closed."""
+    stmt = (
+        update(TaskORM)
+        .where(*_overdue_conditions(until), TaskORM.deadline >= since)
+        .values(status=TaskStatusEnum.DONE, closed_at=now)
+        .returning(TaskORM.id, TaskORM.project_id)
+        .execution_options(synchronize_session=False)
+    )
+    rows = session.execute(stmt).all()
+    _touch(session, (project_id for _, project_id in rows))
+    return len(rows)
+
+
+def autoclose_incremental(*, chunk_days: Optional[int] = None, today: Optional[date] = None) -> int:
+    """
+    Close the tasks whose deadline passed since the previous run.
+
+    The job_state row of AUTOCLOSE_JOB holds a high-water mark: every task with
+    a deadline before it has been processed. A run only looks at deadlines in
+    [mark, today), so repeated runs on the same day find nothing to do. Tasks
+    that get an older deadline (or are reopened) afterwards are left alone;
+    `autoclose_overdue_tasks` closes those (the scheduler runs it daily).
+
+    The first run (no mark yet) sets the mark to the oldest overdue deadline
+    and then catches up from there like after downtime. The missed days are
+    caught up `chunk_days` (AUTOCLOSE_CATCHUP_CHUNK_DAYS) at a time; each chunk
+    is one transaction that also advances the mark, so an interrupted catch-up
+    resumes where it stopped. The state row is locked whenever the mark is read
+    or written, so concurrent runs do not process the same window twice.
+
+    Returns the number of tasks that were updated.
+    """
+    settings = get_settings()
+    today = today or date.today()
+    chunk = timedelta(days=max(chunk_days or settings.AUTOCLOSE_CATCHUP_CHUNK_DAYS, 1))
+    closed = 0
+
+    with SessionLocal() as session:
+        with unit_of_work(session):
+            state = _lock_job_state(session, AUTOCLOSE_JOB)
+            if state.last_processed_date is None:
+                oldest = session.scalar(
+                    select(func.min(TaskORM.deadline)).where(*_overdue_conditions(today))
+                )
+                state.last_processed_date = oldest or today
+                state.updated_at = datetime.now(UTC)
+
+        while True:
+            with unit_of_work(session):
+                state = _lock_job_state(session, AUTOCLOSE_JOB)
+                since = state.last_processed_date
+                if since >= today:
+                    return closed
+                until = min(since + chunk, today)
+                now = datetime.now(UTC)
+                closed += _close_window(session, since=since, until=until, now=now)
+                state.last_processed_date = until
+                state.updated_at = now
 
 
 def main() -> None:
     """
     Entry point for this command.
     """
-    count = autoclose_overdue_tasks()
+    parser = argparse.ArgumentParser(description="Close overdue tasks.")
+    parser.add_argument("--full", action="store_true",
+                        help="Scan all overdue tasks instead of the days since the previous run")
+    parser.add_argument("--chunk-days", type=int,
+                        help="Days caught up per transaction (default: AUTOCLOSE_CATCHUP_CHUNK_DAYS)")
+    args = parser.parse_args()
+
+    if args.full:
+        count = autoclose_overdue_tasks()
+    else:
+        count = autoclose_incremental(chunk_days=args.chunk_days)
     print(f"Auto-closed {count} overdue tasks.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,133 @@
+"""
+Export all projects and tasks as NDJSON (one JSON object per line).
+
+Rows are streamed from the database through a server-side cursor
+(`yield_per`), so memory use stays constant regardless of table size.
+Projects come first, then tasks grouped by project:
+
+    {"type": "project", "id": ..., "name": ..., "description": ..., "created_at": ...}
+    {"type": "task", "id": ..., "project_id": ..., "title": ..., "status": ..., ...}
+
+Run:
+    python -m todo_app.commands.export [--output FILE] [--batch-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from todo_app.db.models import ProjectORM, TaskORM
+from todo_app.db.session import SessionLocal
+
+DEFAULT_BATCH_SIZE = 1000
+
+_PROJECT_COLUMNS = (
+    ProjectORM.id,
+    ProjectORM.name,
+    ProjectORM.description,
+    ProjectORM.created_at,
+)
+_TASK_COLUMNS = (
+    TaskORM.id,
+    TaskORM.project_id,
+    TaskORM.title,
+    TaskORM.description,
+    TaskORM.status,
+    TaskORM.deadline,
+    TaskORM.created_at,
+    TaskORM.closed_at,
+)
+
+
+def iter_export_lines(session: Session, *, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Yield NDJSON lines for every project, then every task.
+
+    Plain columns are selected (no ORM objects, nothing kept in the identity
+    map) and fetched `batch_size` rows at a time. On PostgreSQL both queries
+    run in one REPEATABLE READ transaction, so the export is a consistent snapshot.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    projects = (
+        select(*_PROJECT_COLUMNS)
+        .order_by(ProjectORM.created_at, ProjectORM.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in session.execute(projects):
+        yield orjson.dumps(
+            {
+                "type": "project",
+                "id": row.id,
+                "name": row.name,
+                "description": row.description or "",
+                "created_at": row.created_at,
+            }
+        ) + b"\n"
+
+    # (project_id, created_at) follows ix_tasks_project_id_created_at
+    tasks = (
+        select(*_TASK_COLUMNS)
+        .order_by(TaskORM.project_id, TaskORM.created_at, TaskORM.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in session.execute(tasks):
+        yield orjson.dumps(
+            {
+                "type": "task",
+                "id": row.id,
+                "project_id": row.project_id,
+                "title": row.title,
+                "description": row.description or "",
+                "status": row.status.value,
+                "deadline": row.deadline,
+                "created_at": row.created_at,
+                "closed_at": row.closed_at,
+            }
+        ) + b"\n"
+
+
+def stream_export(*, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """iter_export_lines over a session of its own, closed when the stream ends."""
+    with SessionLocal() as session:
+        yield from iter_export_lines(session, batch_size=batch_size)
+
+
+def export_to(out: BinaryIO, *, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Write the export to a binary stream; returns the number of lines written."""
+    count = 0
+    for line in stream_export(batch_size=batch_size):
+        out.write(line)
+        count += 1
+    return count
+
+
+def main() -> None:
+    """
+    Entry point for this command.
+    """
+    parser = argparse.ArgumentParser(description="Export projects and tasks as NDJSON.")
+    parser.add_argument("--output", "-o", help="File to write (default: stdout)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Rows fetched per round trip")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, "wb") as out:
+            count = export_to(out, batch_size=args.batch_size)
+        print(f"Exported {count} records to {args.output}.", file=sys.stderr)
+    else:
+        count = export_to(sys.stdout.buffer, batch_size=args.batch_size)
+        print(f"Exported {count} records.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
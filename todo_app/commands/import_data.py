@@ -0,0 +1,409 @@
+"""
+Bulk import of projects and tasks from NDJSON or CSV.
+
+The input is read as a stream, one record at a time. Every record is checked
+against the domain rules (it is turned into a `Project` / `Task`, which runs
+their `__post_init__` validation); invalid records are skipped and reported
+with their line number. Valid rows are loaded with PostgreSQL `COPY` into
+temporary staging tables, `batch_size` rows per COPY, and then merged into
+`projects` / `tasks` with two set-based upserts, all in one transaction.
+Memory use is bounded by one batch, whatever the size of the input.
+
+Records use the format written by `todo_app.commands.export`:
+
+    {"type": "project", "id": ..., "name": ..., "description": ..., "created_at": ...}
+    {"type": "task", "id": ..., "project_id": ..., "title": ..., "description": ...,
+     "status": ..., "deadline": "YYYY-MM-DD", "created_at": ..., "closed_at": ...}
+
+CSV files carry the same fields as a header row (a missing `type` column means
+every row is a task). `id` and `created_at` are generated when absent. Rows
+with an existing id update that project / task; a task is never moved to
+another project, and tasks of unknown projects are skipped. Like the other
+management commands, the importer works below the services, so the project
+and task caps (MAX_NUMBER_OF_PROJECT / MAX_NUMBER_OF_TASK) do not apply.
+
+Run:
+    python -m todo_app.commands.import_data FILE [--format ndjson|csv] [--batch-size N]
+    (FILE may be "-" for stdin)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, UTC
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Literal, Optional, Set, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from todo_app.cache import get_cache
+from todo_app.db.session import SessionLocal
+from todo_app.db.unit_of_work import unit_of_work
+from todo_app.models import Project, Task
+from todo_app.models.task import parse_deadline
+
+if TYPE_CHECKING:
+    from todo_app.services import TaskSavedListener
+
+ImportFormat = Literal["ndjson", "csv"]
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# Only the first errors are kept; the rest are just counted in `skipped`
+MAX_REPORTED_ERRORS = 100
+
+# Column sizes of projects.name / tasks.title (checked up front so one long
+# value does not abort the whole COPY)
+_MAX_NAME_LENGTH = 100
+_MAX_TITLE_LENGTH = 200
+
+_PROJECT_COLUMNS = ("line", "id", "name", "description", "created_at")
+_TASK_COLUMNS = (
+    "line", "id", "project_id", "title", "description", "status", "deadline", "created_at", "closed_at",
+)
+
+_CREATE_STAGING = (
+    """
+    CREATE TEMP TABLE import_projects (
+        line bigint NOT NULL,
+        id varchar(36) NOT NULL,
+        name varchar(100) NOT NULL,
+        description text,
+        created_at timestamptz NOT NULL
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMP TABLE import_tasks (
+        line bigint NOT NULL,
+        id varchar(36) NOT NULL,
+        project_id varchar(36) NOT NULL,
+        title varchar(200) NOT NULL,
+        description text,
+        status text NOT NULL,
+        deadline date,
+        created_at timestamptz NOT NULL,
+        closed_at timestamptz
+    ) ON COMMIT DROP
+    """,
+)
+
+# DISTINCT ON keeps the last occurrence of an id in the input
+_MERGE_PROJECTS = text(
+    """
+    INSERT INTO projects (id, name, description, created_at, revision, updated_at)
+    SELECT DISTINCT ON (id) id, name, description, created_at, 0, now()
+    FROM import_projects
+    ORDER BY id, line DESC
+    ON CONFLICT (id) DO UPDATE
+    SET name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        revision = projects.revision + 1,
+        updated_at = now()
+    RETURNING id
+    """
+)
+
+_MERGE_TASKS = text(
+    """
+    INSERT INTO tasks (id, project_id, title, description, status, deadline, created_at, closed_at)
+    SELECT DISTINCT ON (s.id)
+           s.id, s.project_id, s.title, s.description, CAST(s.status AS taskstatusenum),
+           s.deadline, s.created_at, s.closed_at
+    FROM import_tasks AS s
+    JOIN projects AS p ON p.id = s.project_id
+    ORDER BY s.id, s.line DESC
+    ON CONFLICT (id) DO UPDATE
+    SET title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        status = EXCLUDED.status,
+        deadline = EXCLUDED.deadline,
+        closed_at = EXCLUDED.closed_at
+    WHERE tasks.project_id = EXCLUDED.project_id
+    RETURNING id, deadline, status
+    """
+)
+
+# Same effect as repositories.task_repository.touch_projects, for every project the import wrote to
+_TOUCH_PROJECTS = text(
+    """
+    UPDATE projects
+    SET revision = revision + 1, updated_at = now()
+    WHERE id IN (SELECT DISTINCT project_id FROM import_tasks)
+    RETURNING id
+    """
+)
+
+
+@dataclass
+class ImportResult:
+    projects: int = 0
+    tasks: int = 0
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def reject(self, line: int, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line}: {message}")
+
+
+# -------- Reading --------
+def _iter_ndjson(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield line_no, ValueError(f"Invalid JSON ({e}).")
+
+
+def _iter_csv(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    for row in reader:
+        # Empty cells mean "not given"
+        yield reader.line_num, {k: v for k, v in row.items() if k and v not in (None, "")}
+
+
+def iter_records(stream: BinaryIO, fmt: ImportFormat) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (line number, record) pairs; a record that could not be parsed is
+    yielded as the ValueError describing it.
+    """
+    if fmt == "csv":
+        return _iter_csv(stream)
+    if fmt == "ndjson":
+        return _iter_ndjson(stream)
+    raise ValueError("Invalid format. Allowed: ndjson | csv")
+
+
+# -------- Validation --------
+def _text(record: Dict[str, Any], name: str, *, required: bool = False) -> str:
+    value = record.get(name)
+    if value is None:
+        if required:
+            raise ValueError(f"Missing field '{name}'.")
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"Field '{name}' must be a string.")
+    return value
+
+
+def _uuid(value: Any, name: str) -> str:
+    try:
+        return str(UUID(str(value)))
+    except ValueError:
+        raise ValueError(f"Field '{name}' must be a UUID.")
+
+
+def _timestamp(value: Any, name: str) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"Field '{name}' must be an ISO 8601 timestamp.")
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _identity(record: Dict[str, Any]) -> Dict[str, Any]:
+    """id / created_at keyword arguments, when the record provides them."""
+    kwargs: Dict[str, Any] = {}
+    if record.get("id") is not None:
+        kwargs["id"] = _uuid(record["id"], "id")
+    if record.get("created_at") is not None:
+        kwargs["created_at"] = _timestamp(record["created_at"], "created_at")
+    return kwargs
+
+
+def project_row(line: int, record: Dict[str, Any]) -> tuple:
+    """Staging row of a project record (raises ValueError when it breaks a rule)."""
+    name = _text(record, "name", required=True)
+    if len(name) > _MAX_NAME_LENGTH:
+        raise ValueError(f"Project name must be ≤ {_MAX_NAME_LENGTH} characters.")
+    project = Project(name=name, description=_text(record, "description"), **_identity(record))
+    return line, project.id, project.name, project.description, project.created_at
+
+
+def task_row(line: int, record: Dict[str, Any]) -> tuple:
+    """Staging row of a task record (raises ValueError when it breaks a rule)."""
+    if record.get("project_id") is None:
+        raise ValueError("Missing field 'project_id'.")
+    project_id = _uuid(record["project_id"], "project_id")
+    title = _text(record, "title", required=True)
+    if len(title) > _MAX_TITLE_LENGTH:
+        raise ValueError(f"Title must be ≤ {_MAX_TITLE_LENGTH} characters.")
+    deadline = record.get("deadline")
+    if deadline is not None and not isinstance(deadline, str):
+        raise ValueError("Invalid deadline format. Use YYYY-MM-DD.")
+    task = Task(
+        title=title,
+        description=_text(record, "description"),
+        status=record.get("status") or "todo",
+        deadline=parse_deadline(deadline),
+        **_identity(record),
+    )
+    closed_at = _timestamp(record.get("closed_at"), "closed_at")
+    return (
+        line, task.id, project_id, task.title, task.description, task.status,
+        task.deadline, task.created_at, closed_at,
+    )
+
+
+# -------- Loading --------
+class _StagingWriter:
+    """Buffers staging rows as CSV and COPYs them into a staging table once `batch_size` rows are pending."""
+
+    def __init__(self, cursor: Any, table: str, columns: Tuple[str, ...], batch_size: int) -> None:
+        # Empty unquoted fields are NULL; FORCE_NOT_NULL keeps empty names/titles as ''
+        not_null = "name" if table == "import_projects" else "title"
+        self._sql = (
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NOT_NULL ({not_null}))"
+        )
+        self._cursor = cursor
+        self._batch_size = batch_size
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = 0
+        self.rows = 0
+
+    def add(self, row: tuple) -> None:
+        self._writer.writerow(row)
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._buffer.seek(0)
+        self._cursor.copy_expert(self._sql, self._buffer)
+        self.rows += self._pending
+        self._pending = 0
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+
+def import_records(session: Session, stream: BinaryIO, fmt: ImportFormat, *,
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   on_task_saved: Optional[TaskSavedListener] = None) -> Tuple[ImportResult, Set[str]]:
+    """
+    Load a stream into the database (see module docstring) without committing.
+    Returns the result and the ids of the projects that were written to;
+    on_task_saved is called with every task inserted or updated.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        raise RuntimeError("import_data requires PostgreSQL (it loads rows with COPY).")
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive.")
+
+    for ddl in _CREATE_STAGING:
+        session.execute(text(ddl))
+    cursor = session.connection().connection.dbapi_connection.cursor()
+    projects = _StagingWriter(cursor, "import_projects", _PROJECT_COLUMNS, batch_size)
+    tasks = _StagingWriter(cursor, "import_tasks", _TASK_COLUMNS, batch_size)
+
+    result = ImportResult()
+    for line, record in iter_records(stream, fmt):
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            if not isinstance(record, dict):
+                raise ValueError("Record must be an object.")
+            kind = record.get("type") or "task"
+            if kind == "project":
+                projects.add(project_row(line, record))
+            elif kind == "task":
+                tasks.add(task_row(line, record))
+            else:
+                raise ValueError("Invalid type. Allowed: project | task")
+        except ValueError as e:
+            result.reject(line, str(e))
+    projects.flush()
+    tasks.flush()
+    cursor.close()
+
+    touched: Set[str] = set()
+    try:
+        touched.update(session.execute(_MERGE_PROJECTS).scalars())
+        result.projects = len(touched)
+        for task_id, deadline, task_status in session.execute(_MERGE_TASKS):
+            result.tasks += 1
+            if on_task_saved is not None:
+                on_task_saved(task_id, deadline, task_status)
+        touched.update(session.execute(_TOUCH_PROJECTS).scalars())
+    except IntegrityError as e:
+        # e.g. a project name already used by another project
+        raise ValueError(f"Import conflicts with existing data: {e.orig}") from e
+    # Duplicated ids, tasks of unknown projects, tasks of another project
+    result.skipped += (projects.rows - result.projects) + (tasks.rows - result.tasks)
+    return result, touched
+
+
+def import_stream(stream: BinaryIO, fmt: ImportFormat, *,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  on_task_saved: Optional[TaskSavedListener] = None) -> ImportResult:
+    """
+    Import a stream in one transaction of its own; the cached reads of
+    every project it wrote to are invalidated after the commit, and only
+    then is on_task_saved called with every task the import saved.
+    """
+    saved: List[Tuple[str, Optional[date], str]] = []
+    with SessionLocal() as session, unit_of_work(session):
+        result, touched = import_records(
+            session, stream, fmt, batch_size=batch_size,
+            on_task_saved=None if on_task_saved is None else lambda *row: saved.append(row),
+        )
+
+    cache = get_cache()
+    if cache is not None:
+        for project_id in touched:
+            cache.invalidate(project_id)
+    if on_task_saved is not None:
+        for row in saved:
+            on_task_saved(*row)
+    return result
+
+
+def guess_format(filename: str) -> ImportFormat:
+    return "csv" if filename.lower().endswith(".csv") else "ndjson"
+
+
+def main() -> None:
+    """
+    Entry point for this command.
+    """
+    parser = argparse.ArgumentParser(description="Import projects and tasks from NDJSON or CSV.")
+    parser.add_argument("file", help='File to read ("-" for stdin)')
+    parser.add_argument("--format", choices=("ndjson", "csv"),
+                        help="Input format (default: from the file extension, else ndjson)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Rows sent per COPY")
+    args = parser.parse_args()
+
+    fmt = args.format or guess_format(args.file)
+    try:
+        if args.file == "-":
+            result = import_stream(sys.stdin.buffer, fmt, batch_size=args.batch_size)
+        else:
+            with open(args.file, "rb") as stream:
+                result = import_stream(stream, fmt, batch_size=args.batch_size)
+    except ValueError as e:
+        sys.exit(f"Import failed: {e}")
+
+    print(f"Imported {result.projects} projects and {result.tasks} tasks; skipped {result.skipped} records.")
+    for error in result.errors:
+        print(error, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,47 @@
-from __future__ import annotations
+"""
+Run the background jobs (see todo_app.scheduler.jobs) until stopped.
 
-import time
+Several replicas may run at once: a PostgreSQL advisory lock elects one
+leader, and only the leader runs jobs; the others take over if it goes away.
 
-import schedule
+Run:
+    python -m todo_app.commands.scheduler
+"""
 
-from todo_app.commands.autoclose_overdue import autoclose_overdue_tasks
+from __future__ import annotations
 
+import signal
 
-def run_autoclose_job() -> None:
-    """
-    Job wrapper: calls the autoclose command once and logs the result.
-    """
-    count = autoclose_overdue_tasks()
-    print(f"[scheduler] Auto-closed {count} overdue tasks.")
+from todo_app.config import get_settings
+from todo_app.db.session import get_engine
+from todo_app.scheduler import LeaderElection, Scheduler
+from todo_app.scheduler.jobs import build_registry
+from todo_app.scheduler.runner import log
 
 
 def main() -> None:
     """
     Run the scheduler loop.
-
-    For development we use a short interval.
     """
-    # every 15 seconds for demo/presentation
-    schedule.every(15).seconds.do(run_autoclose_job)
-    print("[scheduler] Started. Running autoclose job every 15 seconds. Press Ctrl+C to stop.")
-
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    settings = get_settings()
+    registry = build_registry(settings)
+    scheduler = Scheduler(
+        registry,
+        workers=settings.SCHEDULER_WORKERS,
+        leader=LeaderElection(get_engine(), settings.SCHEDULER_LOCK_KEY),
+    )
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.request_stop())
+
+    jobs = ", ".join(f"{job.name} every {job.interval:g}s" for job in registry)
+    log(f"Started ({jobs}). Press Ctrl+C to stop.")
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log("Stopping; waiting for running jobs.")
+        scheduler.shutdown()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1 +1,10 @@
-from .settings import settings, Settings
\ No newline at end of file
+from typing import Any
+
+from ._settings import Settings, get_settings
+
+
+def __getattr__(name: str) -> Any:
+    # `settings` is built lazily on first access (see get_settings)
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
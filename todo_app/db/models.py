@@ -5,21 +5,36 @@ from typing import Optional, List
 
 import enum
 from sqlalchemy import (
+    Computed,
+    Integer,
     String,
     Text,
     Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     Mapped,
+    deferred,
     mapped_column,
     relationship,
 )
 
 from todo_app.db.base import Base
 
+# Text search configuration of tasks.search_vector (and of the queries against it)
+TASK_SEARCH_CONFIG = "english"
+
+# Title words weigh more than description words when ranking search results
+TASK_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
 
 class TaskStatusEnum(str, enum.Enum):
     TODO = "todo"
@@ -45,6 +60,16 @@ class ProjectORM(Base):
         nullable=False,
     )
 
+    # Version of the project and its tasks, bumped by every change to either
+    # (see repositories.task_repository.touch_projects); drives API ETags.
+    revision: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+        nullable=False,
+    )
+
     # One-to-many relationship with Task
     tasks: Mapped[List["TaskORM"]] = relationship(
         back_populates="project",
@@ -55,6 +80,25 @@ class ProjectORM(Base):
 
 class TaskORM(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Listing tasks of a project (filter by project_id, ordered by creation time)
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at"),
+        # Cross-project queries (GET /tasks): keyset order and deadline windows
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_deadline_id", "deadline", "id"),
+        # Overdue scan of the autoclose job: only open tasks are indexed
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+        ),
+        # Full-text search over title/description
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    # Don't fetch server-generated values (search_vector) after INSERT/UPDATE:
+    # the default ("auto") would add RETURNING search_vector to every ORM insert
+    __mapper_args__ = {"eager_defaults": False}
 
     # PK: Same as in the domain, used as str(UUID)
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -93,7 +137,31 @@ class TaskORM(Base):
         nullable=True,
     )
 
+    # Generated by the database from title/description on every insert and update
+    # (including bulk statements and COPY); deferred so regular reads skip it.
+    search_vector: Mapped[Optional[str]] = deferred(
+        mapped_column(TSVECTOR, Computed(TASK_SEARCH_VECTOR_SQL, persisted=True))
+    )
+
     # Reverse relationship: each task is connected to a project
     project: Mapped["ProjectORM"] = relationship(
         back_populates="tasks",
     )
+
+
+class JobStateORM(Base):
+    """Progress of a background job between runs (e.g. the autoclose high-water mark)."""
+
+    __tablename__ = "job_state"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    # High-water mark: tasks with a deadline before this date have been processed
+    last_processed_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+        nullable=False,
+    )
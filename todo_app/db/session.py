@@ -1,22 +1,184 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict
 
-from todo_app.config import settings
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from todo_app.config import get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+class PoolStats:
+    """Thread-safe accumulator for connection checkout wait times."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += waited
+            if waited > self.max_wait:
+                self.max_wait = waited
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(avg * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats.record(time.perf_counter() - start)
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool counterpart of TimedQueuePool."""
+
+    def _do_get(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats.record(time.perf_counter() - start)
+
+
+def _connect_args() -> Dict[str, Any]:
+    """Driver connect arguments (server-side statement timeout for psycopg2)."""
+    settings = get_settings()
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        return {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return {}
 
-# SQLAlchemy Engine: manages connections to the Postgres database
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=False,   # For debugging, you can temporarily set to True to log SQL queries
-    future=True,  # Use modern SQLAlchemy 2.x API
-)
+
+def _async_connect_args() -> Dict[str, Any]:
+    """Driver connect arguments for asyncpg (same statement timeout as _connect_args)."""
+    settings = get_settings()
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        return {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+    return {}
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    SQLAlchemy Engine: manages connections to the Postgres database.
+
+    Created on first use, so importing this module does not load the
+    DB driver (psycopg2) or open a pool.
+    """
+    settings = get_settings()
+    return create_engine(
+        settings.DATABASE_URL,
+        echo=False,   # For debugging, you can temporarily set to True to log SQL queries
+        future=True,  # Use modern SQLAlchemy 2.x API
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=_connect_args(),
+    )
+
+
+class _LazySessionMaker(sessionmaker):
+    """sessionmaker that binds itself to get_engine() when the first Session is created."""
+
+    def __call__(self, **local_kw: Any) -> Session:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
 
 
 # Session factory: we use this wherever we need a database Session
-SessionLocal = sessionmaker(
-    bind=engine,
+SessionLocal = _LazySessionMaker(
     autoflush=False,
     autocommit=False,
 )
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatible `from todo_app.db.session import engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> "AsyncEngine":
+    """
+    Async engine (asyncpg) used when settings.DB_ASYNC is enabled.
+    Created on first use so the async driver is only imported when needed.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = get_settings()
+    return create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        echo=False,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=_async_connect_args(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> "async_sessionmaker[AsyncSession]":
+    """AsyncSession factory bound to get_async_engine()."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+def get_pool_status() -> Dict[str, Any]:
+    """Report current pool usage together with checkout wait statistics."""
+    settings = get_settings()
+    pool = get_async_engine().pool if settings.DB_ASYNC else get_engine().pool
+    status: Dict[str, Any] = {
+        "size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    status.update(pool_stats.snapshot())
+    return status
@@ -0,0 +1,51 @@
+"""
+Unit of work: one transaction per API request or CLI action.
+
+Repositories only add, change and flush rows; they never commit. Whoever owns
+the session (api.dependencies.get_db / get_async_db, a management command, a
+CLI action) commits once at the end, or rolls back if anything failed, so a
+service operation that touches several rows costs a single commit.
+
+Work that must only happen once the changes are visible to other sessions
+(e.g. invalidating cached reads) is registered with `after_commit`; it runs
+after the commit and is discarded on rollback.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_AFTER_COMMIT = "todo_app.after_commit"
+
+
+def after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """Run `callback` once the current transaction of `session` commits."""
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    callbacks: List[Callable[[], None]] = session.info.pop(_AFTER_COMMIT, [])
+    for callback in callbacks:
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """Commit `session` when the block succeeds, roll it back when it raises."""
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+    session.commit()
@@ -1,2 +1,2 @@
-from .project import Project
+from .project import Project, TaskCollection
 from .task import Task, TaskStatus, ALLOWED_STATUSES, parse_deadline
\ No newline at end of file
@@ -5,19 +5,61 @@ Project entity that contains a collection of tasks.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
-from typing import List
+from typing import Dict, Iterable, Iterator, Optional
 from uuid import uuid4
 
 from .task import Task, word_count
 
 
-@dataclass
+class TaskCollection:
+    """
+    Insertion-ordered collection of a project's tasks, indexed by task id.
+
+    Iterates like a list of tasks, but membership checks, lookups and
+    removals by id are O(1).
+    """
+
+    __slots__ = ("_by_id",)
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._by_id: Dict[str, Task] = {t.id: t for t in tasks}
+
+    def add(self, task: Task) -> None:
+        self._by_id[task.id] = task
+
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._by_id.get(task_id)
+
+    def remove(self, task_id: str) -> bool:
+        return self._by_id.pop(task_id, None) is not None
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._by_id
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskCollection):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(slots=True)
 class Project:
     name: str
     description: str = ""
     id: str = field(default_factory=lambda: str(uuid4()))
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    tasks: List[Task] = field(default_factory=list)
+    tasks: TaskCollection = field(default_factory=TaskCollection)
 
     def __post_init__(self):
         # Validate lengths (≤ 30 words name, ≤ 150 words description)
@@ -25,16 +67,39 @@ class Project:
             raise ValueError("Project name must be ≤ 30 words.")
         if word_count(self.description) > 150:
             raise ValueError("Project description must be ≤ 150 words.")
+        # Accept any iterable of tasks (e.g. a list), as before the collection was indexed
+        if not isinstance(self.tasks, TaskCollection):
+            self.tasks = TaskCollection(self.tasks)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        id: str,
+        name: str,
+        description: str,
+        created_at: datetime,
+        tasks: Iterable[Task] = (),
+    ) -> Project:
+        """
+        Rebuild a Project from already-validated data (e.g. a DB row).
+        Skips __post_init__ validation and the id/created_at default factories.
+        """
+        project = object.__new__(cls)
+        project.id = id
+        project.name = name
+        project.description = description
+        project.created_at = created_at
+        project.tasks = TaskCollection(tasks)
+        return project
 
     def add_task(self, task: Task) -> None:
         """Add a task to the project."""
-        self.tasks.append(task)
+        self.tasks.add(task)
 
     def remove_task(self, task_id: str) -> bool:
         """Remove a task by id from the project; returns True if removed."""
-        before = len(self.tasks)
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-        return len(self.tasks) < before
+        return self.tasks.remove(task_id)
 
     def edit(self, *, name: str | None = None, description: str | None = None) -> None:
         """Edit project fields with validation."""
@@ -26,7 +26,7 @@ def word_count(s: str) -> int:
     return len([w for w in s.split() if w.strip()])
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str
     description: str = ""
@@ -45,6 +45,30 @@ class Task:
         if word_count(self.description) > 150:
             raise ValueError("Description must be ≤ 150 words.")
 
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        id: str,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        deadline: Optional[date],
+        created_at: datetime,
+    ) -> Task:
+        """
+        Rebuild a Task from already-validated data (e.g. a DB row).
+        Skips __post_init__ validation and the id/created_at default factories.
+        """
+        task = object.__new__(cls)
+        task.id = id
+        task.title = title
+        task.description = description
+        task.status = status
+        task.deadline = deadline
+        task.created_at = created_at
+        return task
+
     def change_status(self, new_status: TaskStatus) -> None:
         """Change task status."""
         if new_status not in ALLOWED_STATUSES:
@@ -1,6 +1,10 @@
 from .project_repository import ProjectRepository, SqlAlchemyProjectRepository
 from .task_repository import TaskRepository, SqlAlchemyTaskRepository
 from .in_memory_repo import InMemoryRepo
+from .cached_repository import CachedProjectRepository, CachedTaskRepository
+from .pagination import Page
+from .task_filter import TaskFilter
+from .task_search import TaskSearchHit
 
 __all__ = [
     "ProjectRepository",
@@ -8,4 +12,9 @@ __all__ = [
     "SqlAlchemyProjectRepository",
     "SqlAlchemyTaskRepository",
     "InMemoryRepo",
+    "CachedProjectRepository",
+    "CachedTaskRepository",
+    "Page",
+    "TaskFilter",
+    "TaskSearchHit",
 ]
\ No newline at end of file
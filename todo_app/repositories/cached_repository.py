@@ -0,0 +1,248 @@
+"""
+Read-through caching decorators for the repositories.
+
+Single-object reads (a project by id, a task by id) are served from a
+ReadThroughCache and filled from the wrapped repository on a miss; every write
+invalidates the affected project, which also drops the cached responses of that
+project. List, count, query and search reads always go to the wrapped repository.
+
+Object entries are keyed by the project's revision, read from the database on
+every lookup. Invalidation only reaches the process that wrote with the memory
+backend; with the revision in the key, another worker's stale entries are
+simply never looked up again, so a body built from a cached object always
+matches the revision (and ETag) it is served under.
+
+With a transactional repository, pass the unit of work's hook as `after_commit`
+so the invalidation happens once the write is committed: invalidating earlier
+would let a concurrent reader cache the old rows again. Until then, the
+projects written through this instance bypass the cache.
+
+Meant for the database repositories: InMemoryRepo already lives in memory and
+mutates the objects it hands out, which a cache of copies would bypass.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Callable, List, Optional, Sequence, Set, Tuple
+
+from todo_app.cache import ReadThroughCache
+from todo_app.models import Project, Task, TaskStatus
+from todo_app.repositories.pagination import Page
+from todo_app.repositories.project_repository import ProjectRepository
+from todo_app.repositories.task_filter import TaskFilter, TaskSort
+from todo_app.repositories.task_repository import TaskRepository
+from todo_app.repositories.task_search import TaskSearchHit
+
+
+def _project_key(include_tasks: bool, revision: int) -> str:
+    return f"project:with_tasks:{revision}" if include_tasks else f"project:{revision}"
+
+
+def _task_key(task_id: str, revision: int) -> str:
+    return f"task:{task_id}:{revision}"
+
+
+AfterCommit = Callable[[Callable[[], None]], None]
+
+
+class _Invalidator:
+    """Invalidates written projects, right away or through an after-commit hook."""
+
+    def __init__(self, cache: ReadThroughCache, after_commit: Optional[AfterCommit]) -> None:
+        self._cache = cache
+        self._after_commit = after_commit
+        self.pending: Set[str] = set()
+
+    def __call__(self, project_id: str) -> None:
+        if self._after_commit is None:
+            self._cache.invalidate(project_id)
+            return
+        if project_id not in self.pending:
+            self.pending.add(project_id)
+            self._after_commit(lambda: self._commit(project_id))
+
+    def _commit(self, project_id: str) -> None:
+        self.pending.discard(project_id)
+        self._cache.invalidate(project_id)
+
+
+class CachedProjectRepository(ProjectRepository):
+    def __init__(self, inner: ProjectRepository, cache: ReadThroughCache, *,
+                 after_commit: Optional[AfterCommit] = None) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._invalidate = _Invalidator(cache, after_commit)
+
+    def add_project(self, project: Project) -> None:
+        self._inner.add_project(project)
+
+    def get_project_by_id(self, project_id: str, *, include_tasks: bool = True) -> Optional[Project]:
+        if project_id in self._invalidate.pending:
+            return self._inner.get_project_by_id(project_id, include_tasks=include_tasks)
+        revision = self._inner.get_project_revision(project_id)
+        if revision is None:
+            return None
+        return self._cache.get_or_load(
+            project_id,
+            _project_key(include_tasks, revision),
+            lambda: self._inner.get_project_by_id(project_id, include_tasks=include_tasks),
+        )
+
+    def get_project_by_name(self, name: str) -> Optional[Project]:
+        return self._inner.get_project_by_name(name)
+
+    def list_projects(self, *, include_tasks: bool = True) -> List[Project]:
+        return self._inner.list_projects(include_tasks=include_tasks)
+
+    def list_projects_page(self, *, limit: int, cursor: Optional[str] = None,
+                           include_tasks: bool = False) -> Page[Project]:
+        return self._inner.list_projects_page(limit=limit, cursor=cursor, include_tasks=include_tasks)
+
+    def count_projects(self) -> int:
+        return self._inner.count_projects()
+
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        # Always read through: the revision is what tells clients whether anything changed
+        return self._inner.get_project_revision(project_id)
+
+    def get_projects_version(self) -> str:
+        return self._inner.get_projects_version()
+
+    def update_project(self, project: Project, *, new_name: Optional[str] = None,
+                       new_description: Optional[str] = None,
+                       include_tasks: bool = True) -> Project:
+        try:
+            return self._inner.update_project(
+                project, new_name=new_name, new_description=new_description,
+                include_tasks=include_tasks,
+            )
+        finally:
+            self._invalidate(project.id)
+
+    def delete_project(self, project_id: str) -> bool:
+        try:
+            return self._inner.delete_project(project_id)
+        finally:
+            self._invalidate(project_id)
+
+
+class CachedTaskRepository(TaskRepository):
+    """`revision_of` returns a project's current revision (ProjectRepository.get_project_revision)."""
+
+    def __init__(self, inner: TaskRepository, cache: ReadThroughCache, *,
+                 revision_of: Callable[[str], Optional[int]],
+                 after_commit: Optional[AfterCommit] = None) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._revision_of = revision_of
+        self._invalidate = _Invalidator(cache, after_commit)
+
+    def _project_of(self, task_id: str) -> Optional[str]:
+        project_id = self._cache.project_of_task(task_id)
+        if project_id is None:
+            project_id = self._inner.get_task_project_id(task_id)
+            if project_id is not None:
+                self._cache.remember_task(task_id, project_id)
+        return project_id
+
+    def add_task(self, project: Project, task: Task) -> None:
+        try:
+            self._inner.add_task(project, task)
+        finally:
+            self._invalidate(project.id)
+
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        try:
+            self._inner.add_tasks(project, tasks)
+        finally:
+            self._invalidate(project.id)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        project_id = self._project_of(task_id)
+        if project_id is None:
+            return None
+        return self.get_task_in_project(project_id, task_id)
+
+    def get_task_in_project(self, project_id: str, task_id: str) -> Optional[Task]:
+        if project_id in self._invalidate.pending:
+            return self._inner.get_task_in_project(project_id, task_id)
+        revision = self._revision_of(project_id)
+        if revision is None:
+            return None
+        task = self._cache.get_or_load(
+            project_id,
+            _task_key(task_id, revision),
+            lambda: self._inner.get_task_in_project(project_id, task_id),
+        )
+        if task is not None:
+            self._cache.remember_task(task_id, project_id)
+        return task
+
+    def get_task_project_id(self, task_id: str) -> Optional[str]:
+        return self._project_of(task_id)
+
+    def list_tasks_of_project(self, project_id: str) -> List[Task]:
+        return self._inner.list_tasks_of_project(project_id)
+
+    def list_tasks_page(self, project_id: str, *, limit: int, cursor: Optional[str] = None,
+                        task_filter: Optional[TaskFilter] = None,
+                        sort: TaskSort = "created_at") -> Page[Task]:
+        return self._inner.list_tasks_page(
+            project_id, limit=limit, cursor=cursor, task_filter=task_filter, sort=sort
+        )
+
+    def query_tasks(self, task_filter: Optional[TaskFilter] = None, *, limit: int,
+                    cursor: Optional[str] = None,
+                    sort: TaskSort = "created_at") -> Page[Tuple[str, Task]]:
+        return self._inner.query_tasks(task_filter, limit=limit, cursor=cursor, sort=sort)
+
+    def search_tasks(self, query: str, *, limit: int, cursor: Optional[str] = None,
+                     task_filter: Optional[TaskFilter] = None) -> Page[TaskSearchHit]:
+        return self._inner.search_tasks(query, limit=limit, cursor=cursor, task_filter=task_filter)
+
+    def count_tasks(self, project_id: Optional[str] = None,
+                    task_filter: Optional[TaskFilter] = None) -> int:
+        return self._inner.count_tasks(project_id, task_filter)
+
+    def update_task(self, task_id: str, **kwargs) -> Task:
+        project_id = self._project_of(task_id)
+        try:
+            return self._inner.update_task(task_id, **kwargs)
+        finally:
+            if project_id is not None:
+                self._invalidate(project_id)
+
+    def change_task_status(self, task_id: str, new_status: TaskStatus) -> Task:
+        project_id = self._project_of(task_id)
+        try:
+            return self._inner.change_task_status(task_id, new_status)
+        finally:
+            if project_id is not None:
+                self._invalidate(project_id)
+
+    def delete_task(self, task_id: str) -> bool:
+        project_id = self._project_of(task_id)
+        try:
+            return self._inner.delete_task(task_id)
+        finally:
+            self._cache.forget_task(task_id)
+            if project_id is not None:
+                self._invalidate(project_id)
+
+    def change_tasks_status(self, project_id: str, new_status: TaskStatus, *,
+                            task_ids: Optional[Sequence[str]] = None,
+                            task_filter: Optional[TaskFilter] = None) -> List[Tuple[str, Optional[date]]]:
+        try:
+            return self._inner.change_tasks_status(
+                project_id, new_status, task_ids=task_ids, task_filter=task_filter
+            )
+        finally:
+            self._invalidate(project_id)
+
+    def delete_tasks(self, project_id: str, *, task_ids: Optional[Sequence[str]] = None,
+                     task_filter: Optional[TaskFilter] = None) -> int:
+        try:
+            return self._inner.delete_tasks(project_id, task_ids=task_ids, task_filter=task_filter)
+        finally:
+            self._invalidate(project_id)
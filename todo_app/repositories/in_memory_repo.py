@@ -1,17 +1,72 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from todo_app.models import Project, Task, TaskStatus
+from todo_app.repositories.pagination import CursorKey, Page, decode_cursor, is_after, make_page
 from todo_app.repositories.project_repository import ProjectRepository
+from todo_app.repositories.task_filter import (
+    TaskFilter,
+    TaskSort,
+    decode_task_cursor,
+    sort_spec,
+    task_sort_key,
+)
+from todo_app.repositories.task_search import TaskSearchHit, TextIndex
 from todo_app.repositories.task_repository import TaskRepository
 
+
+def _remove_sorted(keys: List, key) -> None:
+    """Remove an exact key from a sorted list (binary search, no full scan)."""
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
+
+def _order_tasks(tasks: Iterable[Task], sort: TaskSort) -> List[Task]:
+    """Order tasks by (sort field, id); tasks without a value come last."""
+    field_name, descending = sort_spec(sort)
+    present = [t for t in tasks if getattr(t, field_name) is not None]
+    missing = [t for t in tasks if getattr(t, field_name) is None]
+    present.sort(key=lambda t: (getattr(t, field_name), t.id), reverse=descending)
+    missing.sort(key=lambda t: t.id, reverse=descending)
+    return present + missing
+
+
 class InMemoryRepo(ProjectRepository, TaskRepository):
     def __init__(self) -> None:
         # Projects
         self._projects_by_id: Dict[str, Project] = {}
         self._project_name_index: Dict[str, str] = {}  # name -> project_id (enforce unique names)
+        self._project_order: List[Tuple[datetime, str]] = []  # sorted (created_at, project_id)
+        self._revisions: Dict[str, int] = {}  # project_id -> revision (ETag version)
+        self._projects_version = 0  # bumped when a project is added, changed or deleted
         # Tasks
         self._tasks_by_id: Dict[str, Tuple[str, Task]] = {}  # task_id -> (project_id, Task)
+        # Secondary task indexes (kept in sync by every task mutation below)
+        self._task_ids_by_status: Dict[str, Set[str]] = {}  # status -> {task_id}
+        self._deadline_index: List[Tuple[date, str]] = []  # sorted (deadline, task_id)
+        self._text_index = TextIndex()  # title/description words -> task ids
+
+    # -------- Index maintenance --------
+    def _index_task(self, task: Task) -> None:
+        self._task_ids_by_status.setdefault(task.status, set()).add(task.id)
+        if task.deadline is not None:
+            insort(self._deadline_index, (task.deadline, task.id))
+
+    def _unindex_task(self, task: Task) -> None:
+        ids = self._task_ids_by_status.get(task.status)
+        if ids is not None:
+            ids.discard(task.id)
+        if task.deadline is not None:
+            _remove_sorted(self._deadline_index, (task.deadline, task.id))
+
+    def _touch_project(self, project_id: str) -> None:
+        if project_id in self._revisions:
+            self._revisions[project_id] += 1
+            self._projects_version += 1
 
     # -------- Projects --------
     def add_project(self, project: Project) -> None:
@@ -19,20 +74,40 @@ class InMemoryRepo(ProjectRepository, TaskRepository):
             raise ValueError("Project name must be unique.")
         self._projects_by_id[project.id] = project
         self._project_name_index[project.name] = project.id
+        insort(self._project_order, (project.created_at, project.id))
+        self._revisions[project.id] = 0
+        self._projects_version += 1
 
-    def get_project_by_id(self, project_id: str) -> Optional[Project]:
+    def get_project_by_id(self, project_id: str, *, include_tasks: bool = True) -> Optional[Project]:
         return self._projects_by_id.get(project_id)
 
     def get_project_by_name(self, name: str) -> Optional[Project]:
         pid = self._project_name_index.get(name)
         return self._projects_by_id.get(pid) if pid else None
 
-    def list_projects(self) -> List[Project]:
-        # Sort by created_at ascending (as per requirement)
-        return sorted(self._projects_by_id.values(), key=lambda p: p.created_at)
+    def list_projects(self, *, include_tasks: bool = True) -> List[Project]:
+        # Already ordered by created_at ascending (as per requirement)
+        return [self._projects_by_id[pid] for _, pid in self._project_order]
+
+    def list_projects_page(self, *, limit: int, cursor: Optional[str] = None,
+                           include_tasks: bool = False) -> Page[Project]:
+        start = bisect_right(self._project_order, decode_cursor(cursor, datetime)) if cursor is not None else 0
+        keys = self._project_order[start:start + limit + 1]
+        rows = [self._projects_by_id[pid] for _, pid in keys]
+        return make_page(rows, limit, key=lambda p: (p.created_at, p.id))
+
+    def count_projects(self) -> int:
+        return len(self._projects_by_id)
+
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        return self._revisions.get(project_id)
+
+    def get_projects_version(self) -> str:
+        return str(self._projects_version)
 
     def update_project(self, project: Project, *, new_name: Optional[str] = None,
-                       new_description: Optional[str] = None) -> Project:
+                       new_description: Optional[str] = None,
+                       include_tasks: bool = True) -> Project:
         if new_name is not None and new_name != project.name:
             if new_name in self._project_name_index:
                 raise ValueError("Project name must be unique.")
@@ -43,49 +118,194 @@ class InMemoryRepo(ProjectRepository, TaskRepository):
             self._project_name_index[new_name] = project.id
         if new_description is not None:
             project.edit(description=new_description)
+        self._touch_project(project.id)
         return project
 
     def delete_project(self, project_id: str) -> bool:
         proj = self._projects_by_id.pop(project_id, None)
         if not proj:
             return False
-        # remove name index
+        # remove name and ordering indexes
         self._project_name_index.pop(proj.name, None)
+        _remove_sorted(self._project_order, (proj.created_at, proj.id))
         # cascade delete tasks
         for t in list(proj.tasks):
             self.delete_task(t.id)  # removes from task map
+        self._revisions.pop(project_id, None)
+        self._projects_version += 1
         return True
 
     # -------- Tasks --------
     def add_task(self, project: Project, task: Task) -> None:
         project.add_task(task)
         self._tasks_by_id[task.id] = (project.id, task)
+        self._index_task(task)
+        self._text_index.add(task.id, task.title, task.description)
+        self._touch_project(project.id)
+
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        for task in tasks:
+            self.add_task(project, task)
 
     def get_task(self, task_id: str) -> Optional[Task]:
         pair = self._tasks_by_id.get(task_id)
         return pair[1] if pair else None
 
+    def get_task_project_id(self, task_id: str) -> Optional[str]:
+        pair = self._tasks_by_id.get(task_id)
+        return pair[0] if pair else None
+
+    def get_task_in_project(self, project_id: str, task_id: str) -> Optional[Task]:
+        pair = self._tasks_by_id.get(task_id)
+        if not pair or pair[0] != project_id:
+            return None
+        return pair[1]
+
     def list_tasks_of_project(self, project_id: str) -> List[Task]:
         proj = self._projects_by_id.get(project_id)
         return list(proj.tasks) if proj else []
 
+    def list_tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """All tasks with the given status (status index lookup)."""
+        return [self._tasks_by_id[tid][1] for tid in self._task_ids_by_status.get(status, ())]
+
+    def _deadline_range(self, due_from: Optional[date],
+                        due_to: Optional[date]) -> Tuple[int, int]:
+        """Bounds of the [due_from, due_to] slice of the deadline index."""
+        lo = bisect_left(self._deadline_index, (due_from,)) if due_from is not None else 0
+        # (due_to,) sorts before every (due_to, task_id); step one day past it
+        hi = (bisect_left(self._deadline_index, (due_to + timedelta(days=1),))
+              if due_to is not None else len(self._deadline_index))
+        return lo, hi
+
+    def list_tasks_by_deadline(self, *, due_from: Optional[date] = None,
+                               due_to: Optional[date] = None) -> List[Task]:
+        """Tasks with a deadline in [due_from, due_to], ordered by deadline (range scan)."""
+        lo, hi = self._deadline_range(due_from, due_to)
+        return [self._tasks_by_id[tid][1] for _, tid in self._deadline_index[lo:hi]]
+
+    def _filtered_tasks(self, project_id: Optional[str],
+                        task_filter: Optional[TaskFilter]) -> List[Task]:
+        """
+        Tasks matching the filter (of one project, or across projects). Candidates
+        come from whichever is smallest: the deadline index range, the status
+        index, the selected projects or all tasks.
+        """
+        f = task_filter or TaskFilter()
+        project_ids = f.project_ids
+        if project_id is not None:
+            project_ids = (project_id,) if project_ids is None or project_id in project_ids else ()
+
+        candidates: Iterable[Task]
+        if project_ids is not None:
+            projects = [self._projects_by_id[pid] for pid in dict.fromkeys(project_ids)
+                        if pid in self._projects_by_id]
+            candidates = (t for proj in projects for t in proj.tasks)
+            best = sum(len(proj.tasks) for proj in projects)
+        else:
+            candidates = (t for _, t in self._tasks_by_id.values())
+            best = len(self._tasks_by_id)
+        if replace(f, project_ids=None).is_empty():
+            return list(candidates)
+
+        if f.has_deadline_range:
+            lo, hi = self._deadline_range(f.due_from, f.due_to)
+            if hi - lo < best:
+                best = hi - lo
+                candidates = (self._tasks_by_id[tid][1] for _, tid in self._deadline_index[lo:hi])
+        if f.statuses is not None:
+            # A status given twice (?status=todo&status=todo) must not list its tasks twice
+            buckets = [self._task_ids_by_status.get(s, set()) for s in dict.fromkeys(f.statuses)]
+            if sum(len(b) for b in buckets) < best:
+                candidates = (self._tasks_by_id[tid][1] for b in buckets for tid in b)
+
+        allowed = set(project_ids) if project_ids is not None else None
+        return [
+            t for t in candidates
+            if (allowed is None or self._tasks_by_id[t.id][0] in allowed) and f.matches(t)
+        ]
+
+    @staticmethod
+    def _task_page(tasks: Iterable[Task], *, limit: int, cursor: Optional[str],
+                   sort: TaskSort) -> Page[Task]:
+        """Order tasks by `sort` and cut the page that starts after `cursor`."""
+        _, descending = sort_spec(sort)
+        ordered = _order_tasks(tasks, sort)
+        start = 0
+        if cursor is not None:
+            after: CursorKey = decode_task_cursor(cursor, sort)
+            start = bisect_left(
+                ordered, True,
+                key=lambda t: is_after(task_sort_key(t, sort), after, descending=descending),
+            )
+        return make_page(ordered[start:start + limit + 1], limit,
+                         key=lambda t: task_sort_key(t, sort))
+
+    def list_tasks_page(self, project_id: str, *, limit: int,
+                        cursor: Optional[str] = None,
+                        task_filter: Optional[TaskFilter] = None,
+                        sort: TaskSort = "created_at") -> Page[Task]:
+        return self._task_page(self._filtered_tasks(project_id, task_filter),
+                               limit=limit, cursor=cursor, sort=sort)
+
+    def query_tasks(self, task_filter: Optional[TaskFilter] = None, *, limit: int,
+                    cursor: Optional[str] = None,
+                    sort: TaskSort = "created_at") -> Page[Tuple[str, Task]]:
+        page = self._task_page(self._filtered_tasks(None, task_filter),
+                               limit=limit, cursor=cursor, sort=sort)
+        items = [(self._tasks_by_id[t.id][0], t) for t in page.items]
+        return Page(items=items, next_cursor=page.next_cursor)
+
+    def search_tasks(self, query: str, *, limit: int, cursor: Optional[str] = None,
+                     task_filter: Optional[TaskFilter] = None) -> Page[TaskSearchHit]:
+        f = task_filter or TaskFilter()
+        allowed = set(f.project_ids) if f.project_ids is not None else None
+        hits = []
+        for task_id, score in self._text_index.search(query).items():
+            project_id, task = self._tasks_by_id[task_id]
+            if (allowed is None or project_id in allowed) and f.matches(task):
+                hits.append(TaskSearchHit(project_id=project_id, task=task, score=score))
+        hits.sort(key=lambda h: (-h.score, h.task.id))
+        start = 0
+        if cursor is not None:
+            after_score, after_id = decode_cursor(cursor, float)
+            start = bisect_right(hits, (-after_score, after_id), key=lambda h: (-h.score, h.task.id))
+        return make_page(hits[start:start + limit + 1], limit, key=lambda h: (h.score, h.task.id))
+
+    def count_tasks(self, project_id: Optional[str] = None,
+                    task_filter: Optional[TaskFilter] = None) -> int:
+        if project_id is None and (task_filter is None or task_filter.is_empty()):
+            return len(self._tasks_by_id)
+        return len(self._filtered_tasks(project_id, task_filter))
+
     def update_task(self, task_id: str, **kwargs) -> Task:
         task = self.get_task(task_id)
         if not task:
             raise ValueError("Task not found.")
-        task.edit(
-            title=kwargs.get("title"),
-            description=kwargs.get("description"),
-            status=kwargs.get("status"),
-            deadline_str=kwargs.get("deadline_str"),
-        )
+        self._unindex_task(task)
+        try:
+            task.edit(
+                title=kwargs.get("title"),
+                description=kwargs.get("description"),
+                status=kwargs.get("status"),
+                deadline_str=kwargs.get("deadline_str"),
+            )
+        finally:
+            self._index_task(task)
+            self._text_index.add(task.id, task.title, task.description)
+        self._touch_project(self._tasks_by_id[task_id][0])
         return task
 
     def change_task_status(self, task_id: str, new_status: TaskStatus) -> Task:
         task = self.get_task(task_id)
         if not task:
             raise ValueError("Task not found.")
-        task.change_status(new_status)
+        self._unindex_task(task)
+        try:
+            task.change_status(new_status)
+        finally:
+            self._index_task(task)
+        self._touch_project(self._tasks_by_id[task_id][0])
         return task
 
     def delete_task(self, task_id: str) -> bool:
@@ -93,7 +313,43 @@ class InMemoryRepo(ProjectRepository, TaskRepository):
         if not pair:
             return False
         project_id, task = pair
+        self._unindex_task(task)
+        self._text_index.remove(task_id)
         proj = self._projects_by_id.get(project_id)
         if proj:
             proj.remove_task(task_id)
+        self._touch_project(project_id)
         return True
+
+    def _select_tasks(self, project_id: str, task_ids: Optional[Sequence[str]],
+                      task_filter: Optional[TaskFilter]) -> List[Task]:
+        if task_ids is None:
+            return self._filtered_tasks(project_id, task_filter)
+        proj = self._projects_by_id.get(project_id)
+        if not proj:
+            return []
+        candidates = [t for t in map(proj.tasks.get, dict.fromkeys(task_ids)) if t is not None]
+        if task_filter is None:
+            return candidates
+        return [t for t in candidates if task_filter.matches(t)]
+
+    def change_tasks_status(self, project_id: str, new_status: TaskStatus, *,
+                            task_ids: Optional[Sequence[str]] = None,
+                            task_filter: Optional[TaskFilter] = None) -> List[Tuple[str, Optional[date]]]:
+        tasks = self._select_tasks(project_id, task_ids, task_filter)
+        for task in tasks:
+            self._unindex_task(task)
+            try:
+                task.change_status(new_status)
+            finally:
+                self._index_task(task)
+        if tasks:
+            self._touch_project(project_id)
+        return [(task.id, task.deadline) for task in tasks]
+
+    def delete_tasks(self, project_id: str, *, task_ids: Optional[Sequence[str]] = None,
+                     task_filter: Optional[TaskFilter] = None) -> int:
+        tasks = self._select_tasks(project_id, task_ids, task_filter)
+        for task in tasks:
+            self.delete_task(task.id)
+        return len(tasks)
@@ -0,0 +1,103 @@
+"""
+Keyset (cursor-based) pagination helpers shared by the repositories.
+
+Items are ordered by (sort value, id) - by default (created_at, id); a cursor
+encodes the sort key of the last item of a page, and the next page starts
+strictly after it. Sort values may be datetimes, dates, floats (search scores)
+or None (e.g. a task without deadline); None values always sort last.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+SortValue = Union[datetime, date, float, None]
+CursorKey = Tuple[SortValue, str]
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _encode_value(value: SortValue) -> str:
+    if value is None:
+        return "n:"
+    if isinstance(value, datetime):
+        return f"t:{value.isoformat()}"
+    if isinstance(value, float):
+        return f"f:{value!r}"
+    return f"d:{value.isoformat()}"
+
+
+def _decode_value(raw: str) -> SortValue:
+    kind, _, text = raw.partition(":")
+    if kind == "n":
+        return None
+    if kind == "t":
+        return datetime.fromisoformat(text)
+    if kind == "d":
+        return date.fromisoformat(text)
+    if kind == "f":
+        return float(text)
+    raise ValueError(raw)
+
+
+def encode_cursor(value: SortValue, item_id: str) -> str:
+    """Encode a (sort value, id) key into an opaque URL-safe cursor."""
+    raw = f"{_encode_value(value)}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, value_type: Optional[type] = None, *,
+                  nullable: bool = False) -> CursorKey:
+    """
+    Decode a cursor produced by encode_cursor; raises ValueError if it is
+    malformed, or if value_type is given and the sort value is not exactly of
+    that type (a datetime is not accepted as a date), or None when nullable.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        value_raw, item_id = raw.split("|", 1)
+        value = _decode_value(value_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid pagination cursor.")
+    if value_type is not None and type(value) is not value_type and not (nullable and value is None):
+        raise ValueError("Invalid pagination cursor.")
+    return value, item_id
+
+
+def is_after(key: CursorKey, cursor: CursorKey, *, descending: bool = False) -> bool:
+    """
+    True if an item with sort key `key` comes strictly after `cursor` in
+    (value, id) order - ascending or descending, with None values last.
+    """
+    value, item_id = key
+    cursor_value, cursor_id = cursor
+    id_after = item_id < cursor_id if descending else item_id > cursor_id
+    if cursor_value is None:
+        return value is None and id_after
+    if value is None:
+        return True
+    if value == cursor_value:
+        return id_after
+    return value < cursor_value if descending else value > cursor_value
+
+
+def make_page(rows: List[T], limit: int, key: Callable[[T], CursorKey]) -> Page[T]:
+    """
+    Build a Page from up to limit + 1 fetched rows: the extra row only signals
+    that another page exists and is not returned.
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = encode_cursor(*key(items[-1])) if has_more and items else None
+    return Page(items=items, next_cursor=next_cursor)
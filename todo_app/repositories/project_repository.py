@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, cast
+from datetime import datetime
+from typing import List, Literal, Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session, joinedload, lazyload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
-from todo_app.models import Project, Task, TaskStatus
+from todo_app.models import Project
 from todo_app.db.models import ProjectORM
+from todo_app.repositories.pagination import Page, decode_cursor, make_page
+from todo_app.repositories.task_repository import _task_from_orm, touch_projects
+
+# How ProjectORM.tasks is loaded when projects are fetched:
+#   "selectin" -> one extra SELECT ... WHERE project_id IN (...) for all projects
+#   "joined"   -> LEFT OUTER JOIN in the same statement
+#   "none"     -> tasks are not loaded at all (summary views; projects have no tasks)
+TaskLoadStrategy = Literal["selectin", "joined", "none"]
 
 
 class ProjectRepository(ABC):
@@ -19,7 +29,8 @@ class ProjectRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_project_by_id(self, project_id: str) -> Optional[Project]:
+    def get_project_by_id(self, project_id: str, *, include_tasks: bool = True) -> Optional[Project]:
+        """Return the project, optionally without loading its tasks (see list_projects)."""
         raise NotImplementedError
 
     @abstractmethod
@@ -27,8 +38,45 @@ class ProjectRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_projects(self) -> List[Project]:
-        """Return projects sorted by created_at ascending (as in Phase 1)."""
+    def list_projects(self, *, include_tasks: bool = True) -> List[Project]:
+        """
+        Return projects sorted by created_at ascending (as in Phase 1).
+
+        If include_tasks is False, implementations may return projects
+        with an empty tasks list (cheaper for summary views).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_projects_page(
+        self,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        include_tasks: bool = False,
+    ) -> Page[Project]:
+        """
+        Return at most `limit` projects ordered by (created_at, id), starting
+        after `cursor`. Raises ValueError for a malformed cursor.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_projects(self) -> int:
+        """Return the total number of stored projects."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        """
+        Return the project's revision, bumped by every change to the project
+        or its tasks (None if the project does not exist).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_projects_version(self) -> str:
+        """Return an opaque token that changes whenever a project is added, changed or deleted."""
         raise NotImplementedError
 
     @abstractmethod
@@ -38,8 +86,12 @@ class ProjectRepository(ABC):
         *,
         new_name: Optional[str] = None,
         new_description: Optional[str] = None,
+        include_tasks: bool = True,
     ) -> Project:
-        """Update project fields and return the updated instance."""
+        """
+        Update project fields and return the updated instance (without its
+        tasks when include_tasks is False).
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -51,43 +103,23 @@ class ProjectRepository(ABC):
 # -------- Helper mappers --------
 
 
-def _project_from_orm(orm: ProjectORM) -> Project:
+def _project_from_orm(orm: ProjectORM, *, include_tasks: bool = True) -> Project:
     """
-    Map ProjectORM -> domain Project (along with the list of Tasks).
+    Map ProjectORM -> domain Project (along with the list of Tasks, unless
+    include_tasks is False, in which case orm.tasks is not touched).
 
-    It is assumed that Project in todo_app.models has fields like:
-      id, name, description, created_at, tasks
-    and Task also has fields id, title, description, status, deadline, created_at.
+    Rows were validated when they were written, so the trusted constructors
+    are used (no domain validation, no id/created_at default factories).
     """
-    # Initialize with keyword arguments to avoid issues with field order
-    proj = Project(
+    tasks = [_task_from_orm(torm) for torm in orm.tasks] if include_tasks else []
+    return Project.from_trusted(
         id=orm.id,
         name=orm.name,
         description=orm.description or "",
         created_at=orm.created_at,
+        tasks=tasks,
     )
 
-    # If Project by default creates its own list of tasks,
-    # we just populate it here.
-    # If desired, you can call proj.tasks.clear() beforehand.
-    for torm in orm.tasks:
-        status_str = cast(
-            TaskStatus,
-            torm.status.value if hasattr(torm.status, "value") else str(torm.status),
-        )
-
-        task = Task(
-            id=torm.id,
-            title=torm.title,
-            description=torm.description or "",
-            status=status_str,
-            deadline=torm.deadline,
-            created_at=torm.created_at,
-        )
-        proj.tasks.append(task)  # type: ignore[attr-defined]
-
-    return proj
-
 
 # -------- SQLAlchemy implementation --------
 
@@ -95,8 +127,22 @@ def _project_from_orm(orm: ProjectORM) -> Project:
 class SqlAlchemyProjectRepository(ProjectRepository):
     """SQLAlchemy-based implementation of ProjectRepository."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, task_loading: TaskLoadStrategy = "selectin") -> None:
         self._session = session
+        self._task_loading = task_loading
+
+    def _with_tasks(self, include_tasks: bool) -> bool:
+        return include_tasks and self._task_loading != "none"
+
+    def _tasks_loader(self, include_tasks: bool = True) -> LoaderOption:
+        """Build the loader option for ProjectORM.tasks so tasks never load lazily per project."""
+        if not self._with_tasks(include_tasks):
+            # Tasks are not mapped in that case (see _project_from_orm), so the
+            # lazy collection is never touched and no query is emitted for it.
+            return lazyload(ProjectORM.tasks)
+        if self._task_loading == "joined":
+            return joinedload(ProjectORM.tasks)
+        return selectinload(ProjectORM.tasks)
 
     def add_project(self, project: Project) -> None:
         """
@@ -110,25 +156,66 @@ class SqlAlchemyProjectRepository(ProjectRepository):
             created_at=project.created_at,  # type: ignore[attr-defined]
         )
         self._session.add(orm)
-        self._session.commit()
+        self._session.flush()
 
-    def get_project_by_id(self, project_id: str) -> Optional[Project]:
-        orm = self._session.get(ProjectORM, project_id)
+    def get_project_by_id(self, project_id: str, *, include_tasks: bool = True) -> Optional[Project]:
+        orm = self._session.get(ProjectORM, project_id, options=[self._tasks_loader(include_tasks)])
         if orm is None:
             return None
-        return _project_from_orm(orm)
+        return _project_from_orm(orm, include_tasks=self._with_tasks(include_tasks))
 
     def get_project_by_name(self, name: str) -> Optional[Project]:
-        stmt = select(ProjectORM).where(ProjectORM.name == name)
+        stmt = select(ProjectORM).where(ProjectORM.name == name).options(self._tasks_loader())
         orm = self._session.scalar(stmt)
         if orm is None:
             return None
-        return _project_from_orm(orm)
+        return _project_from_orm(orm, include_tasks=self._with_tasks(True))
 
-    def list_projects(self) -> List[Project]:
-        stmt = select(ProjectORM).order_by(ProjectORM.created_at.asc())
-        orms = self._session.scalars(stmt).all()
-        return [_project_from_orm(o) for o in orms]
+    def list_projects(self, *, include_tasks: bool = True) -> List[Project]:
+        stmt = (
+            select(ProjectORM)
+            .options(self._tasks_loader(include_tasks))
+            .order_by(ProjectORM.created_at.asc())
+        )
+        # unique() is required when tasks are joined-eager-loaded
+        orms = self._session.scalars(stmt).unique().all()
+        with_tasks = self._with_tasks(include_tasks)
+        return [_project_from_orm(o, include_tasks=with_tasks) for o in orms]
+
+    def list_projects_page(
+        self,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        include_tasks: bool = False,
+    ) -> Page[Project]:
+        stmt = select(ProjectORM).options(self._tasks_loader(include_tasks))
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(ProjectORM.created_at, ProjectORM.id) > tuple_(*decode_cursor(cursor, datetime))
+            )
+        stmt = stmt.order_by(ProjectORM.created_at.asc(), ProjectORM.id.asc()).limit(limit + 1)
+        orms = self._session.scalars(stmt).unique().all()
+        with_tasks = self._with_tasks(include_tasks)
+        projects = [_project_from_orm(o, include_tasks=with_tasks) for o in orms]
+        return make_page(projects, limit, key=lambda p: (p.created_at, p.id))
+
+    def count_projects(self) -> int:
+        stmt = select(func.count()).select_from(ProjectORM)
+        return self._session.scalar(stmt) or 0
+
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        return self._session.scalar(select(ProjectORM.revision).where(ProjectORM.id == project_id))
+
+    def get_projects_version(self) -> str:
+        stmt = select(
+            func.count(),
+            func.coalesce(func.sum(ProjectORM.revision), 0),
+            func.max(ProjectORM.updated_at),
+        ).select_from(ProjectORM)
+        count, revisions, updated_at = self._session.execute(stmt).one()
+        stamp = updated_at.timestamp() if updated_at is not None else 0
+        return f"{count}.{revisions}.{stamp}"
 
     def update_project(
         self,
@@ -136,6 +223,7 @@ class SqlAlchemyProjectRepository(ProjectRepository):
         *,
         new_name: Optional[str] = None,
         new_description: Optional[str] = None,
+        include_tasks: bool = True,
     ) -> Project:
         orm = self._session.get(ProjectORM, project.id)  # type: ignore[attr-defined]
         if orm is None:
@@ -146,14 +234,14 @@ class SqlAlchemyProjectRepository(ProjectRepository):
         if new_description is not None:
             orm.description = new_description
 
-        self._session.commit()
-        self._session.refresh(orm)
-        return _project_from_orm(orm)
+        touch_projects(self._session, [orm.id])
+        self._session.flush()
+        return _project_from_orm(orm, include_tasks=self._with_tasks(include_tasks))
 
     def delete_project(self, project_id: str) -> bool:
         orm = self._session.get(ProjectORM, project_id)
         if orm is None:
             return False
         self._session.delete(orm)
-        self._session.commit()
+        self._session.flush()
         return True
@@ -0,0 +1,94 @@
+"""
+Task selection criteria shared by the repositories.
+
+The SQLAlchemy repository turns a TaskFilter into WHERE clauses; the
+in-memory repository evaluates it against its indexes / Task objects.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, UTC
+from typing import Literal, Optional, Tuple
+
+from todo_app.models import Task, TaskStatus
+from todo_app.repositories.pagination import CursorKey, decode_cursor
+
+# Task list orderings: field name, "-" prefix for descending. Ties are broken
+# by id; tasks without a deadline come last when sorting by deadline.
+TaskSort = Literal["created_at", "-created_at", "deadline", "-deadline"]
+
+
+def sort_spec(sort: TaskSort) -> Tuple[str, bool]:
+    """Split a TaskSort into (field name, descending)."""
+    return sort.lstrip("-"), sort.startswith("-")
+
+
+def task_sort_key(task: Task, sort: TaskSort) -> CursorKey:
+    """(sort value, id) of a task for the given ordering - the keyset cursor key."""
+    field_name, _ = sort_spec(sort)
+    return getattr(task, field_name), task.id
+
+
+def decode_task_cursor(cursor: str, sort: TaskSort) -> CursorKey:
+    """
+    Decode the cursor of a task listing; raises ValueError unless its sort value
+    fits the ordering (a datetime for created_at, a date or None for deadline).
+    """
+    field_name, _ = sort_spec(sort)
+    if field_name == "created_at":
+        return decode_cursor(cursor, datetime)
+    return decode_cursor(cursor, date, nullable=True)
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """
+    All criteria are optional and combined with AND; ranges are inclusive.
+    project_ids is checked by the repositories, since a Task does not know its project.
+    """
+
+    statuses: Optional[Tuple[TaskStatus, ...]] = None
+    due_from: Optional[date] = None
+    due_to: Optional[date] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    project_ids: Optional[Tuple[str, ...]] = None
+
+    def __post_init__(self):
+        # Naive bounds (e.g. ?created_from=2026-01-01T00:00:00) are taken as UTC:
+        # created_at is timezone-aware and cannot be compared with a naive datetime
+        for name in ("created_from", "created_to"):
+            value = getattr(self, name)
+            if value is not None and value.tzinfo is None:
+                object.__setattr__(self, name, value.replace(tzinfo=UTC))
+
+    def is_empty(self) -> bool:
+        return (
+            self.statuses is None
+            and self.project_ids is None
+            and self.due_from is None
+            and self.due_to is None
+            and self.created_from is None
+            and self.created_to is None
+        )
+
+    @property
+    def has_deadline_range(self) -> bool:
+        return self.due_from is not None or self.due_to is not None
+
+    def matches(self, task: Task) -> bool:
+        if self.statuses is not None and task.status not in self.statuses:
+            return False
+        if self.has_deadline_range:
+            if task.deadline is None:
+                return False
+            if self.due_from is not None and task.deadline < self.due_from:
+                return False
+            if self.due_to is not None and task.deadline > self.due_to:
+                return False
+        if self.created_from is not None and task.created_at < self.created_from:
+            return False
+        if self.created_to is not None and task.created_at > self.created_to:
+            return False
+        return True
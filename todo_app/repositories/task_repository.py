@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, cast
+from datetime import date, datetime, UTC
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, cast
 
-from sqlalchemy import select
+from sqlalchemy import Float, Select, and_, delete, func, insert, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from todo_app.models import Project, Task, TaskStatus
-from todo_app.db.models import ProjectORM, TaskORM, TaskStatusEnum
+from todo_app.db.models import TASK_SEARCH_CONFIG, ProjectORM, TaskORM, TaskStatusEnum
+from todo_app.repositories.pagination import CursorKey, Page, decode_cursor, make_page
+from todo_app.repositories.task_filter import (
+    TaskFilter,
+    TaskSort,
+    decode_task_cursor,
+    sort_spec,
+    task_sort_key,
+)
+from todo_app.repositories.task_search import TaskSearchHit
 
 
 class TaskRepository(ABC):
@@ -18,14 +28,85 @@ class TaskRepository(ABC):
         """Attach a task to a project and persist it."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        """Attach several tasks to a project and persist them in one transaction."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_task(self, task_id: str) -> Optional[Task]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_task_in_project(self, project_id: str, task_id: str) -> Optional[Task]:
+        """Return the task only if it belongs to the given project."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_task_project_id(self, task_id: str) -> Optional[str]:
+        """Return the id of the project a task belongs to (None if the task does not exist)."""
+        raise NotImplementedError
+
     @abstractmethod
     def list_tasks_of_project(self, project_id: str) -> List[Task]:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_tasks_page(
+        self,
+        project_id: str,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+        sort: TaskSort = "created_at",
+    ) -> Page[Task]:
+        """
+        Return at most `limit` tasks of a project matching `task_filter`, ordered
+        by `sort` (ties broken by id), starting after `cursor`.
+        Raises ValueError for a malformed cursor.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_tasks(
+        self,
+        task_filter: Optional[TaskFilter] = None,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: TaskSort = "created_at",
+    ) -> Page[Tuple[str, Task]]:
+        """
+        Like list_tasks_page, but across projects (narrowed by task_filter.project_ids).
+        Items are (project_id, task) pairs.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def search_tasks(
+        self,
+        query: str,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> Page[TaskSearchHit]:
+        """
+        Full-text search over task titles and descriptions: tasks containing all
+        query words, best score first (ties broken by id), starting after `cursor`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_tasks(
+        self,
+        project_id: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        """Return the number of stored tasks (of one project, or across all projects)."""
+        raise NotImplementedError
+
     @abstractmethod
     def update_task(self, task_id: str, **kwargs) -> Task:
         """Update fields of a task and return the updated one."""
@@ -40,6 +121,50 @@ class TaskRepository(ABC):
     def delete_task(self, task_id: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def change_tasks_status(
+        self,
+        project_id: str,
+        new_status: TaskStatus,
+        *,
+        task_ids: Optional[Sequence[str]] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> List[Tuple[str, Optional[date]]]:
+        """
+        Set the status of the project's tasks selected by ids and/or filter
+        (both given -> both must match). Returns (id, deadline) of every task changed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_tasks(
+        self,
+        project_id: str,
+        *,
+        task_ids: Optional[Sequence[str]] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        """Delete the project's tasks selected by ids and/or filter; returns the count."""
+        raise NotImplementedError
+
+
+def touch_projects(session: Session, project_ids: Iterable[str]) -> None:
+    """
+    Bump revision/updated_at of the given projects, in the caller's transaction.
+    Called by every write to a project or its tasks; the revision is the ETag version.
+    """
+    ids = sorted(set(project_ids))  # stable lock order for concurrent writers
+    if not ids:
+        return
+    stmt = (
+        update(ProjectORM)
+        .where(ProjectORM.id.in_(ids))
+        .values(revision=ProjectORM.revision + 1, updated_at=datetime.now(UTC))
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(stmt)
+
+
 # -------- Helper mappers --------
 
 def _task_from_orm(orm: TaskORM) -> Task:
@@ -47,15 +172,74 @@ def _task_from_orm(orm: TaskORM) -> Task:
         TaskStatus,
         orm.status.value if hasattr(orm.status, "value") else str(orm.status),
     )
-    t = Task(
+    # Rows were validated when they were written; skip domain validation
+    return Task.from_trusted(
+        id=orm.id,
         title=orm.title,
         description=orm.description or "",
         status=status_str,
         deadline=orm.deadline,
+        created_at=orm.created_at,
     )
-    t.id = orm.id  # type: ignore[attr-defined]
-    t.created_at = orm.created_at  # type: ignore[attr-defined]
-    return t
+
+
+def _filter_conditions(task_filter: Optional[TaskFilter]) -> List[Any]:
+    """Translate a TaskFilter into SQL WHERE clauses on TaskORM."""
+    if task_filter is None:
+        return []
+    conditions: List[Any] = []
+    if task_filter.project_ids is not None:
+        conditions.append(TaskORM.project_id.in_(list(task_filter.project_ids)))
+    if task_filter.statuses is not None:
+        conditions.append(TaskORM.status.in_([TaskStatusEnum(s) for s in task_filter.statuses]))
+    if task_filter.due_from is not None:
+        conditions.append(TaskORM.deadline >= task_filter.due_from)
+    if task_filter.due_to is not None:
+        conditions.append(TaskORM.deadline <= task_filter.due_to)
+    if task_filter.created_from is not None:
+        conditions.append(TaskORM.created_at >= task_filter.created_from)
+    if task_filter.created_to is not None:
+        conditions.append(TaskORM.created_at <= task_filter.created_to)
+    return conditions
+
+
+def _keyset_after(field_name: str, cursor: CursorKey, descending: bool) -> Any:
+    """WHERE clause selecting rows strictly after `cursor` in (field, id) order."""
+    column = getattr(TaskORM, field_name)
+    value, item_id = cursor
+    if field_name == "created_at":
+        # Never NULL: a row-value comparison can use the (..., created_at, id) indexes
+        row, after = tuple_(column, TaskORM.id), tuple_(value, item_id)
+        return row < after if descending else row > after
+    id_after = TaskORM.id < item_id if descending else TaskORM.id > item_id
+    if value is None:
+        return and_(column.is_(None), id_after)
+    value_after = column < value if descending else column > value
+    # NULLs sort last, so they always come after a non-NULL cursor
+    return or_(value_after, and_(column == value, id_after), column.is_(None))
+
+
+def _ordered_page(stmt: Select, *, limit: int, cursor: Optional[str], sort: TaskSort) -> Select:
+    """Apply the keyset cursor, ORDER BY (sort field, id) and LIMIT limit + 1."""
+    field_name, descending = sort_spec(sort)
+    column = getattr(TaskORM, field_name)
+    if cursor is not None:
+        stmt = stmt.where(_keyset_after(field_name, decode_task_cursor(cursor, sort), descending))
+    return stmt.order_by(
+        (column.desc() if descending else column.asc()).nulls_last(),
+        TaskORM.id.desc() if descending else TaskORM.id.asc(),
+    ).limit(limit + 1)
+
+
+def _selection_conditions(
+    project_id: str,
+    task_ids: Optional[Sequence[str]],
+    task_filter: Optional[TaskFilter],
+) -> List[Any]:
+    conditions = [TaskORM.project_id == project_id, *_filter_conditions(task_filter)]
+    if task_ids is not None:
+        conditions.append(TaskORM.id.in_(list(task_ids)))
+    return conditions
 
 
 class SqlAlchemyTaskRepository(TaskRepository):
@@ -80,7 +264,28 @@ class SqlAlchemyTaskRepository(TaskRepository):
             created_at=task.created_at,  # type: ignore[attr-defined]
         )
         self._session.add(orm)
-        self._session.commit()
+        touch_projects(self._session, [proj_orm.id])
+        self._session.flush()
+
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+        # Core-style bulk INSERT: rows are sent as multi-row VALUES batches
+        # without building TaskORM objects or tracking them in the session.
+        rows = [
+            {
+                "id": task.id,
+                "project_id": project.id,
+                "title": task.title,
+                "description": task.description,
+                "status": TaskStatusEnum(task.status),
+                "deadline": task.deadline,
+                "created_at": task.created_at,
+            }
+            for task in tasks
+        ]
+        self._session.execute(insert(TaskORM), rows)
+        touch_projects(self._session, [project.id])
 
     def get_task(self, task_id: str) -> Optional[Task]:
         orm = self._session.get(TaskORM, task_id)
@@ -88,11 +293,93 @@ class SqlAlchemyTaskRepository(TaskRepository):
             return None
         return _task_from_orm(orm)
 
+    def get_task_in_project(self, project_id: str, task_id: str) -> Optional[Task]:
+        # Primary-key lookup; the row stays in the identity map, so a following
+        # update_task/change_task_status on the same session won't hit the DB again.
+        orm = self._session.get(TaskORM, task_id)
+        if orm is None or orm.project_id != project_id:
+            return None
+        return _task_from_orm(orm)
+
+    def get_task_project_id(self, task_id: str) -> Optional[str]:
+        return self._session.scalar(select(TaskORM.project_id).where(TaskORM.id == task_id))
+
     def list_tasks_of_project(self, project_id: str) -> List[Task]:
-        stmt = select(TaskORM).where(TaskORM.project_id == project_id)
+        stmt = (
+            select(TaskORM)
+            .where(TaskORM.project_id == project_id)
+            .order_by(TaskORM.created_at.asc())
+        )
         orms = self._session.scalars(stmt).all()
         return [_task_from_orm(o) for o in orms]
 
+    def list_tasks_page(
+        self,
+        project_id: str,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+        sort: TaskSort = "created_at",
+    ) -> Page[Task]:
+        stmt = select(TaskORM).where(
+            TaskORM.project_id == project_id,
+            *_filter_conditions(task_filter),
+        )
+        stmt = _ordered_page(stmt, limit=limit, cursor=cursor, sort=sort)
+        tasks = [_task_from_orm(o) for o in self._session.scalars(stmt).all()]
+        return make_page(tasks, limit, key=lambda t: task_sort_key(t, sort))
+
+    def query_tasks(
+        self,
+        task_filter: Optional[TaskFilter] = None,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: TaskSort = "created_at",
+    ) -> Page[Tuple[str, Task]]:
+        stmt = select(TaskORM).where(*_filter_conditions(task_filter))
+        stmt = _ordered_page(stmt, limit=limit, cursor=cursor, sort=sort)
+        rows = [(o.project_id, _task_from_orm(o)) for o in self._session.scalars(stmt).all()]
+        return make_page(rows, limit, key=lambda row: task_sort_key(row[1], sort))
+
+    def search_tasks(
+        self,
+        query: str,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> Page[TaskSearchHit]:
+        ts_query = func.websearch_to_tsquery(TASK_SEARCH_CONFIG, query)
+        # float8 so a score sent back in a cursor compares equal to the computed one
+        score = func.ts_rank(TaskORM.search_vector, ts_query).cast(Float)
+        stmt = select(TaskORM, score).where(
+            TaskORM.search_vector.op("@@")(ts_query),
+            *_filter_conditions(task_filter),
+        )
+        if cursor is not None:
+            after_score, after_id = decode_cursor(cursor, float)
+            stmt = stmt.where(
+                or_(score < after_score, and_(score == after_score, TaskORM.id > after_id))
+            )
+        stmt = stmt.order_by(score.desc(), TaskORM.id).limit(limit + 1)
+        hits = [
+            TaskSearchHit(project_id=o.project_id, task=_task_from_orm(o), score=s)
+            for o, s in self._session.execute(stmt).all()
+        ]
+        return make_page(hits, limit, key=lambda h: (h.score, h.task.id))
+
+    def count_tasks(
+        self,
+        project_id: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        stmt = select(func.count()).select_from(TaskORM).where(*_filter_conditions(task_filter))
+        if project_id is not None:
+            stmt = stmt.where(TaskORM.project_id == project_id)
+        return self._session.scalar(stmt) or 0
+
     def update_task(self, task_id: str, **kwargs) -> Task:
         orm = self._session.get(TaskORM, task_id)
         if orm is None:
@@ -114,8 +401,8 @@ class SqlAlchemyTaskRepository(TaskRepository):
             from todo_app.models import parse_deadline  # local import to avoid circular dependency
             orm.deadline = parse_deadline(deadline_str)
 
-        self._session.commit()
-        self._session.refresh(orm)
+        touch_projects(self._session, [orm.project_id])
+        self._session.flush()
         return _task_from_orm(orm)
 
     def change_task_status(self, task_id: str, new_status: str) -> Task:
@@ -123,8 +410,8 @@ class SqlAlchemyTaskRepository(TaskRepository):
         if orm is None:
             raise ValueError("Task not found.")
         orm.status = TaskStatusEnum(new_status)
-        self._session.commit()
-        self._session.refresh(orm)
+        touch_projects(self._session, [orm.project_id])
+        self._session.flush()
         return _task_from_orm(orm)
 
     def delete_task(self, task_id: str) -> bool:
@@ -132,5 +419,43 @@ class SqlAlchemyTaskRepository(TaskRepository):
         if orm is None:
             return False
         self._session.delete(orm)
-        self._session.commit()
+        touch_projects(self._session, [orm.project_id])
+        self._session.flush()
         return True
+
+    def change_tasks_status(
+        self,
+        project_id: str,
+        new_status: TaskStatus,
+        *,
+        task_ids: Optional[Sequence[str]] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> List[Tuple[str, Optional[date]]]:
+        stmt = (
+            update(TaskORM)
+            .where(*_selection_conditions(project_id, task_ids, task_filter))
+            .values(status=TaskStatusEnum(new_status))
+            .returning(TaskORM.id, TaskORM.deadline)
+            .execution_options(synchronize_session=False)
+        )
+        changed = [(task_id, deadline) for task_id, deadline in self._session.execute(stmt)]
+        if changed:
+            touch_projects(self._session, [project_id])
+        return changed
+
+    def delete_tasks(
+        self,
+        project_id: str,
+        *,
+        task_ids: Optional[Sequence[str]] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        stmt = (
+            delete(TaskORM)
+            .where(*_selection_conditions(project_id, task_ids, task_filter))
+            .execution_options(synchronize_session=False)
+        )
+        result = self._session.execute(stmt)
+        if result.rowcount:
+            touch_projects(self._session, [project_id])
+        return result.rowcount
@@ -0,0 +1,76 @@
+"""
+Full-text search over task titles and descriptions.
+
+The SQLAlchemy repository searches the `tasks.search_vector` tsvector column
+(GIN indexed); the in-memory repository keeps a TextIndex, a small inverted
+index with the same AND-of-terms semantics and title-over-description weighting.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Set
+
+from todo_app.models import Task
+
+# Same relative weights as Postgres ts_rank for setweight 'A' (title) and 'B' (description)
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class TaskSearchHit:
+    """A search result: the task, its project and its relevance score."""
+    project_id: str
+    task: Task
+    score: float
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of a text."""
+    return _WORD.findall(text.lower())
+
+
+class TextIndex:
+    """Inverted index: term -> {task_id: weight}."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._terms_by_task: Dict[str, Set[str]] = {}
+
+    def add(self, task_id: str, title: str, description: str) -> None:
+        """Index a task's text, replacing whatever was indexed for it before."""
+        self.remove(task_id)
+        weights: Dict[str, float] = {}
+        for term in tokenize(title):
+            weights[term] = weights.get(term, 0.0) + TITLE_WEIGHT
+        for term in tokenize(description):
+            weights[term] = weights.get(term, 0.0) + DESCRIPTION_WEIGHT
+        for term, weight in weights.items():
+            self._postings.setdefault(term, {})[task_id] = weight
+        self._terms_by_task[task_id] = set(weights)
+
+    def remove(self, task_id: str) -> None:
+        for term in self._terms_by_task.pop(task_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(task_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query: str) -> Dict[str, float]:
+        """Scores of the tasks containing every query term (empty for an empty query)."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return {}
+        # Intersect starting from the rarest term
+        postings = sorted((self._postings.get(t, {}) for t in terms), key=len)
+        scores = dict(postings[0])
+        for other in postings[1:]:
+            scores = {tid: s + other[tid] for tid, s in scores.items() if tid in other}
+            if not scores:
+                break
+        return scores
@@ -0,0 +1,10 @@
+from .leader import LeaderElection
+from .registry import Job, JobRegistry
+from .runner import Scheduler
+
+__all__ = [
+    "Job",
+    "JobRegistry",
+    "LeaderElection",
+    "Scheduler",
+]
@@ -0,0 +1,219 @@
+"""
+Event-driven autoclose: an in-process index of upcoming deadlines and a timer
+that wakes when the earliest one passes.
+
+A task becomes overdue at the local midnight after its deadline (the autoclose
+rule is `deadline < today`). The index is a min-heap of (deadline, task_id) for
+open tasks with a deadline, loaded from the database on startup (through the
+partial index ix_tasks_open_deadline) and kept current by TaskService, which
+reports every created or edited task once its transaction commits (bulk
+status changes included), and by POST /import. The timer
+sleeps until the next deadline passes, then closes exactly the tasks that
+expired.
+
+Each API worker keeps its own index and only hears about its own writes.
+That is safe: closing re-checks `deadline < today AND status <> 'done'` in
+SQL, so stale entries are no-ops, and a task closed by several workers is
+closed once. Tasks written outside the API (the CLI commands) are picked up on
+the next restart, or by the scheduler's full scan job (autoclose_overdue_full,
+daily by default). The incremental autoclose job is no safety net here: it
+only looks at deadlines since its high-water mark.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from datetime import date, datetime, time as dtime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from todo_app.commands.autoclose_overdue import close_overdue_tasks_by_id, iter_open_deadlines
+from todo_app.config import get_settings
+from todo_app.db.session import SessionLocal
+from todo_app.models import Task
+from todo_app.scheduler.runner import log
+
+# Longest single sleep: guards against wall-clock jumps (DST, NTP) while waiting
+_MAX_SLEEP = 3600.0
+# Pause after a failed close before trying again
+_RETRY_DELAY = 30.0
+
+
+class DeadlineIndex:
+    """
+    Thread-safe min-heap of open task deadlines.
+
+    Changed or removed tasks leave stale heap entries behind; they are skipped
+    when popped (lazy deletion) and dropped when the heap is compacted.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[date, str]] = []
+        self._deadlines: Dict[str, date] = {}
+        self._changed = threading.Condition()
+        self._notified = False
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def rebuild(self, entries: Iterable[Tuple[str, date]]) -> None:
+        """Replace the content with (task_id, deadline) pairs."""
+        deadlines = dict(entries)
+        heap = [(deadline, task_id) for task_id, deadline in deadlines.items()]
+        heapq.heapify(heap)
+        with self._changed:
+            self._deadlines = deadlines
+            self._heap = heap
+            self._notify()
+
+    def track(self, task_id: str, deadline: Optional[date], status: str) -> None:
+        """Record the current deadline/status of a task (open tasks with a deadline are kept)."""
+        with self._changed:
+            if deadline is None or status == "done":
+                self._deadlines.pop(task_id, None)
+                return
+            if self._deadlines.get(task_id) == deadline:
+                return
+            self._deadlines[task_id] = deadline
+            heapq.heappush(self._heap, (deadline, task_id))
+            if len(self._heap) > 2 * len(self._deadlines) + 64:
+                self._compact()
+            if self._heap[0] == (deadline, task_id):
+                # New earliest deadline: the timer may have to wake sooner
+                self._notify()
+
+    def restore(self, entries: Iterable[Tuple[str, date]]) -> None:
+        """Put back popped entries, unless their task was tracked again meanwhile."""
+        with self._changed:
+            for task_id, deadline in entries:
+                if task_id not in self._deadlines:
+                    self._deadlines[task_id] = deadline
+                    heapq.heappush(self._heap, (deadline, task_id))
+
+    def track_task(self, task: Task) -> None:
+        self.track(task.id, task.deadline, task.status)
+
+    def next_deadline(self) -> Optional[date]:
+        with self._changed:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_overdue(self, today: date) -> List[Tuple[str, date]]:
+        """Remove and return (task_id, deadline) of every task with deadline < today."""
+        due: List[Tuple[str, date]] = []
+        with self._changed:
+            while self._heap and self._heap[0][0] < today:
+                deadline, task_id = heapq.heappop(self._heap)
+                if self._deadlines.get(task_id) == deadline:
+                    del self._deadlines[task_id]
+                    due.append((task_id, deadline))
+        return due
+
+    def wait(self, timeout: float) -> None:
+        """
+        Block until the earliest deadline may have changed, or for timeout
+        seconds. Returns at once if it changed since the previous wait.
+        """
+        with self._changed:
+            if not self._notified:
+                self._changed.wait(timeout)
+            self._notified = False
+
+    def wake(self) -> None:
+        with self._changed:
+            self._notify()
+
+    def _notify(self) -> None:
+        self._notified = True
+        self._changed.notify_all()
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        self._heap = [(d, tid) for tid, d in self._deadlines.items()]
+        heapq.heapify(self._heap)
+
+
+def seconds_until_overdue(deadline: date, now: datetime) -> float:
+    """Seconds from now until the local midnight after `deadline`."""
+    overdue_at = datetime.combine(deadline + timedelta(days=1), dtime.min)
+    return max((overdue_at - now).total_seconds(), 0.0)
+
+
+class DeadlineTimer:
+    """
+    Background thread closing tasks as their deadlines pass.
+
+    `close` receives the ids of the expired tasks and returns how many it closed.
+    """
+
+    def __init__(
+        self,
+        index: DeadlineIndex,
+        close: Callable[[List[str]], int],
+        *,
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._index = index
+        self._close = close
+        self._now = now
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="deadline-timer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        self._index.wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            now = self._now()
+            due = self._index.pop_overdue(now.date())
+            if due:
+                self._close_due(due)
+                continue
+            deadline = self._index.next_deadline()
+            delay = _MAX_SLEEP if deadline is None else seconds_until_overdue(deadline, now)
+            self._index.wait(min(delay, _MAX_SLEEP))
+
+    def _close_due(self, due: List[Tuple[str, date]]) -> None:
+        try:
+            count = self._close([task_id for task_id, _ in due])
+        except Exception as e:
+            log(f"deadline timer: closing {len(due)} tasks failed: {e!r}; retrying")
+            self._index.restore(due)
+            self._stopped.wait(_RETRY_DELAY)
+            return
+        log(f"deadline timer: auto-closed {count} overdue tasks")
+
+
+@lru_cache(maxsize=1)
+def get_deadline_index() -> Optional[DeadlineIndex]:
+    """The process-wide deadline index, or None when AUTOCLOSE_TIMER is off."""
+    if not get_settings().AUTOCLOSE_TIMER:
+        return None
+    return DeadlineIndex()
+
+
+def start_deadline_timer() -> Optional[DeadlineTimer]:
+    """
+    Load the index from the database and start its timer (None when
+    AUTOCLOSE_TIMER is off). Tasks already overdue are closed right away.
+    """
+    index = get_deadline_index()
+    if index is None:
+        return None
+    with SessionLocal() as session:
+        index.rebuild(iter_open_deadlines(session))
+    timer = DeadlineTimer(index, close_overdue_tasks_by_id)
+    timer.start()
+    log(f"deadline timer: tracking {len(index)} open tasks with a deadline")
+    return timer
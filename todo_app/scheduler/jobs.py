@@ -0,0 +1,52 @@
+"""
+Built-in jobs, with their intervals taken from Settings.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from todo_app.commands.autoclose_overdue import autoclose_incremental, autoclose_overdue_tasks
+from todo_app.config import Settings, get_settings
+from todo_app.scheduler.registry import Job, JobRegistry
+
+
+def run_autoclose_job() -> str:
+    """Close the tasks that became overdue since the previous run."""
+    count = autoclose_incremental()
+    return f"auto-closed {count} overdue tasks"
+
+
+def run_autoclose_full_job() -> str:
+    """
+    Close every overdue task. The incremental job only looks at deadlines
+    since its high-water mark, so this catches tasks that got an older deadline
+    afterwards (import, CLI) or were reopened.
+    """
+    count = autoclose_overdue_tasks()
+    return f"auto-closed {count} overdue tasks (full scan)"
+
+
+def build_registry(settings: Optional[Settings] = None) -> JobRegistry:
+    """Registry of the jobs the scheduler command runs."""
+    settings = settings or get_settings()
+    registry = JobRegistry()
+    registry.add(
+        Job(
+            "autoclose_overdue",
+            run_autoclose_job,
+            interval=settings.SCHEDULER_AUTOCLOSE_INTERVAL_SECONDS,
+            timeout=settings.SCHEDULER_JOB_TIMEOUT_SECONDS,
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        )
+    )
+    registry.add(
+        Job(
+            "autoclose_overdue_full",
+            run_autoclose_full_job,
+            interval=settings.SCHEDULER_AUTOCLOSE_FULL_INTERVAL_SECONDS,
+            timeout=settings.SCHEDULER_JOB_TIMEOUT_SECONDS,
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        )
+    )
+    return registry
@@ -0,0 +1,87 @@
+"""
+Leader election between scheduler replicas with a PostgreSQL advisory lock.
+
+The leader is the replica holding a session-level `pg_try_advisory_lock(key)`
+on a dedicated connection. PostgreSQL releases the lock when that connection
+ends (process exit, crash, network loss), and another replica takes over on its
+next attempt. The leader checks its connection every `heartbeat` seconds and
+steps down when it is gone, so two leaders can overlap for at most that long;
+jobs should therefore be idempotent (autoclose is).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError
+
+
+class LeaderElection:
+    def __init__(self, engine: Engine, key: int, *, heartbeat: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._engine = engine
+        self._key = key
+        self._heartbeat = heartbeat
+        self._clock = clock
+        self._conn: Optional[Connection] = None
+        self._checked_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        return self._conn is not None
+
+    def ensure(self) -> bool:
+        """Keep or try to take the leadership; returns whether this replica is the leader."""
+        if self._engine.dialect.name != "postgresql":
+            # No advisory locks (e.g. SQLite in development): a single replica is assumed
+            return True
+        if self._conn is not None:
+            if self._clock() - self._checked_at < self._heartbeat:
+                return True
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._checked_at = self._clock()
+                return True
+            except DBAPIError:
+                self._close()
+        return self._acquire()
+
+    def release(self) -> None:
+        """Give up the leadership (if held)."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+        except DBAPIError:
+            pass
+        self._close()
+
+    def _acquire(self) -> bool:
+        # AUTOCOMMIT: the lock belongs to the session, so the connection can
+        # sit idle between heartbeats instead of "idle in transaction"
+        try:
+            conn = self._engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        except DBAPIError:
+            return False
+        try:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+            ).scalar()
+        except DBAPIError:
+            acquired = False
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        self._checked_at = self._clock()
+        return True
+
+    def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except DBAPIError:
+                pass
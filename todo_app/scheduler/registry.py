@@ -0,0 +1,61 @@
+"""
+Job definitions and the registry the scheduler runs them from.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    A callable run every `interval` seconds.
+
+    - timeout: seconds a run may take before it is reported as overdue (0 = no limit)
+    - jitter: up to this many seconds are added to every interval at random,
+      so replicas and jobs started together do not hit the database in lockstep
+    """
+
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    timeout: float = 0.0
+    jitter: float = 0.0
+
+    def __post_init__(self):
+        if self.interval <= 0:
+            raise ValueError(f"Job {self.name!r}: interval must be positive.")
+        if self.timeout < 0 or self.jitter < 0:
+            raise ValueError(f"Job {self.name!r}: timeout and jitter must not be negative.")
+
+
+class JobRegistry:
+    """Jobs by name, in registration order."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, Job] = {}
+
+    def add(self, job: Job) -> Job:
+        if job.name in self._jobs:
+            raise ValueError(f"Job {job.name!r} is already registered.")
+        self._jobs[job.name] = job
+        return job
+
+    def job(self, name: str, *, interval: float, timeout: float = 0.0,
+            jitter: float = 0.0) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """Decorator form of add()."""
+        def register(func: Callable[[], Any]) -> Callable[[], Any]:
+            self.add(Job(name, func, interval=interval, timeout=timeout, jitter=jitter))
+            return func
+        return register
+
+    def get(self, name: str) -> Optional[Job]:
+        return self._jobs.get(name)
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(self._jobs.values())
+
+    def __len__(self) -> int:
+        return len(self._jobs)
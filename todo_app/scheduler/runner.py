@@ -0,0 +1,119 @@
+"""
+The scheduler loop.
+
+The loop itself never runs job code: due jobs are submitted to a thread pool,
+so a slow job does not delay the others. A job is never run twice at once:
+if its previous run is still going when it is due again, that run is skipped.
+A run longer than the job's timeout is reported; Python threads cannot be
+interrupted, so the run keeps its slot (and later runs keep being skipped)
+until it returns. Database work is bounded server-side by DB_STATEMENT_TIMEOUT_MS.
+
+With a LeaderElection, only the replica holding the leadership submits jobs.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from todo_app.scheduler.leader import LeaderElection
+from todo_app.scheduler.registry import Job, JobRegistry
+
+# Longest sleep of the loop, so stop requests and leadership changes are seen quickly
+_MAX_SLEEP = 1.0
+
+
+def log(message: str) -> None:
+    print(f"[scheduler] {message}", flush=True)
+
+
+@dataclass
+class _Run:
+    future: Future
+    started: float
+    overdue: bool = False
+
+
+class Scheduler:
+    def __init__(
+        self,
+        registry: JobRegistry,
+        *,
+        workers: int,
+        leader: Optional[LeaderElection] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("Number of workers must be positive.")
+        self._registry = registry
+        self._leader = leader
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scheduler-job")
+        self._stop = threading.Event()
+        self._running: Dict[str, _Run] = {}
+        # First runs are spread over the jitter window right after start
+        now = clock()
+        self._next_run: Dict[str, float] = {
+            job.name: now + random.uniform(0, job.jitter) for job in registry
+        }
+
+    def _schedule_next(self, job: Job, now: float) -> None:
+        self._next_run[job.name] = now + job.interval + random.uniform(0, job.jitter)
+
+    def _execute(self, job: Job) -> None:
+        start = time.perf_counter()
+        result = job.func()
+        elapsed = time.perf_counter() - start
+        suffix = f": {result}" if result is not None else ""
+        log(f"{job.name} finished in {elapsed:.2f}s{suffix}")
+
+    def _reap(self, now: float) -> None:
+        """Forget finished runs (reporting failures) and report runs past their timeout."""
+        for name, run in list(self._running.items()):
+            if run.future.done():
+                del self._running[name]
+                error = run.future.exception()
+                if error is not None:
+                    log(f"{name} failed: {error!r}")
+                continue
+            job = self._registry.get(name)
+            if job is not None and job.timeout and not run.overdue and now - run.started > job.timeout:
+                run.overdue = True
+                log(f"{name} exceeded its timeout of {job.timeout:g}s and is still running")
+
+    def run_pending(self) -> None:
+        """Submit every job that is due (one iteration of the loop)."""
+        now = self._clock()
+        self._reap(now)
+        if self._leader is not None and not self._leader.ensure():
+            return
+        for job in self._registry:
+            if now < self._next_run[job.name]:
+                continue
+            self._schedule_next(job, now)
+            if job.name in self._running:
+                log(f"{job.name} skipped: previous run still in progress")
+                continue
+            self._running[job.name] = _Run(self._executor.submit(self._execute, job), now)
+
+    def run_forever(self) -> None:
+        """Run until request_stop() is called."""
+        while not self._stop.is_set():
+            self.run_pending()
+            delay = min(self._next_run.values(), default=self._clock() + _MAX_SLEEP) - self._clock()
+            self._stop.wait(min(max(delay, 0.0), _MAX_SLEEP))
+
+    def request_stop(self) -> None:
+        """Make run_forever() return (safe to call from a signal handler)."""
+        self._stop.set()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop submitting, wait for running jobs (if wait) and give up the leadership."""
+        self._stop.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if self._leader is not None:
+            self._leader.release()
@@ -1,2 +1,3 @@
 from .project_service import ProjectService
-from .task_service import TaskService
+from .task_service import BulkTaskResult, TaskSavedListener, TaskService
+from .async_service import AsyncService
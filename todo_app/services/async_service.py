@@ -0,0 +1,61 @@
+"""
+Awaitable facade over the (sync) services for the async API stack.
+
+Business rules stay in ProjectService/TaskService; this wrapper only decides
+*how* a service call is executed:
+
+- over an AsyncSession (asyncpg): the call runs through AsyncSession.run_sync,
+  so the repositories' queries are awaited on the event loop without a thread;
+- over a regular Session (psycopg2): the call runs in the threadpool.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+Runner = Callable[[Callable[[S], R]], Awaitable[R]]
+
+
+class AsyncService(Generic[S]):
+    """Expose every public method of a sync service as a coroutine function."""
+
+    def __init__(self, runner: Runner) -> None:
+        self._run = runner
+
+    @classmethod
+    def over_async_session(
+        cls, session: "AsyncSession", factory: Callable[["Session"], S]
+    ) -> "AsyncService[S]":
+        """Build the service on the session's sync facade inside run_sync (asyncpg I/O)."""
+
+        async def runner(fn: Callable[[S], R]) -> R:
+            return await session.run_sync(lambda sync_session: fn(factory(sync_session)))
+
+        return cls(runner)
+
+    @classmethod
+    def in_threadpool(cls, service: S) -> "AsyncService[S]":
+        """Run calls of an already built sync service in the threadpool."""
+        from starlette.concurrency import run_in_threadpool
+
+        async def runner(fn: Callable[[S], R]) -> R:
+            return await run_in_threadpool(fn, service)
+
+        return cls(runner)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._run(lambda service: getattr(service, name)(*args, **kwargs))
+
+        call.__name__ = name
+        return call
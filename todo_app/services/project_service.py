@@ -1,9 +1,9 @@
 from __future__ import annotations
 from typing import List, Optional
 
-from todo_app.config import settings
+from todo_app.config import get_settings
 from todo_app.models import Project
-from todo_app.repositories import ProjectRepository
+from todo_app.repositories import Page, ProjectRepository
 
 
 class ProjectService:
@@ -11,9 +11,9 @@ class ProjectService:
         self._repo = repo
 
     def create_project(self, *, name: str, description: str = "") -> Project:
-        projects = self._repo.list_projects()
-        if len(projects) >= settings.MAX_NUMBER_OF_PROJECT:
-            raise ValueError(f"Project cap exceeded ({settings.MAX_NUMBER_OF_PROJECT}).")
+        cap = get_settings().MAX_NUMBER_OF_PROJECT
+        if self._repo.count_projects() >= cap:
+            raise ValueError(f"Project cap exceeded ({cap}).")
 
         project = Project(name=name, description=description)
         self._repo.add_project(project)
@@ -21,18 +21,38 @@ class ProjectService:
 
     def edit_project(self, project_id: str, *, new_name: Optional[str] = None,
                      new_description: Optional[str] = None) -> Project:
-        proj = self._repo.get_project_by_id(project_id)
+        """Rename/redescribe a project; it is returned without its tasks."""
+        proj = self._repo.get_project_by_id(project_id, include_tasks=False)
         if not proj:
             raise ValueError("Project not found.")
-        return self._repo.update_project(proj, new_name=new_name, new_description=new_description)
+        return self._repo.update_project(
+            proj, new_name=new_name, new_description=new_description, include_tasks=False
+        )
 
     def delete_project(self, project_id: str) -> None:
         ok = self._repo.delete_project(project_id)
         if not ok:
             raise ValueError("Project not found.")
 
-    def list_projects(self) -> List[Project]:
-        return self._repo.list_projects()
+    def get_project(self, project_id: str, *, include_tasks: bool = True) -> Optional[Project]:
+        return self._repo.get_project_by_id(project_id, include_tasks=include_tasks)
+
+    def list_projects(self, *, include_tasks: bool = True) -> List[Project]:
+        return self._repo.list_projects(include_tasks=include_tasks)
+
+    def list_projects_page(self, *, limit: int, cursor: Optional[str] = None) -> Page[Project]:
+        return self._repo.list_projects_page(limit=limit, cursor=cursor)
+
+    def count_projects(self) -> int:
+        return self._repo.count_projects()
+
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        """Version of the project and its tasks (None if the project does not exist)."""
+        return self._repo.get_project_revision(project_id)
+
+    def get_projects_version(self) -> str:
+        """Version of the project list."""
+        return self._repo.get_projects_version()
 
     def get_by_name(self, name: str) -> Optional[Project]:
         return self._repo.get_project_by_name(name)
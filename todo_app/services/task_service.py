@@ -1,16 +1,44 @@
 from __future__ import annotations
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
 
-from todo_app.config import settings
-from todo_app.models import Task, parse_deadline, TaskStatus
+from todo_app.config import get_settings
+from todo_app.models import ALLOWED_STATUSES, Task, parse_deadline, TaskStatus
+from todo_app.repositories.pagination import Page
 from todo_app.repositories.project_repository import ProjectRepository
+from todo_app.repositories.task_filter import TaskFilter, TaskSort
 from todo_app.repositories.task_repository import TaskRepository
+from todo_app.repositories.task_search import TaskSearchHit
+
+# Called with (task_id, deadline, status) of a task created or changed
+TaskSavedListener = Callable[[str, Optional[date], TaskStatus], None]
+
+
+@dataclass
+class BulkTaskResult:
+    """Outcome of one item of TaskService.add_tasks: the created task or the validation error."""
+    index: int
+    task: Optional[Task] = None
+    error: Optional[str] = None
 
 
 class TaskService:
-    def __init__(self, project_repo: ProjectRepository, task_repo: TaskRepository) -> None:
+    def __init__(self, project_repo: ProjectRepository, task_repo: TaskRepository, *,
+                 on_task_saved: Optional[TaskSavedListener] = None) -> None:
+        """
+        on_task_saved is called for every task created or changed through
+        this service, bulk changes included (e.g. to keep the deadline timer
+        index current).
+        """
         self._project_repo = project_repo
         self._task_repo = task_repo
+        self._on_task_saved = on_task_saved
+
+    def _saved(self, task: Task) -> Task:
+        if self._on_task_saved is not None:
+            self._on_task_saved(task.id, task.deadline, task.status)
+        return task
 
     def add_task(
             self,
@@ -22,11 +50,11 @@ class TaskService:
             deadline_str: Optional[str] = None,
     ) -> Task:
         # Enforce cap over all tasks
-        total_tasks = sum(len(p.tasks) for p in self._project_repo.list_projects())
-        if total_tasks >= settings.MAX_NUMBER_OF_TASK:
-            raise ValueError(f"Task cap exceeded ({settings.MAX_NUMBER_OF_TASK}).")
+        cap = get_settings().MAX_NUMBER_OF_TASK
+        if self._task_repo.count_tasks() >= cap:
+            raise ValueError(f"Task cap exceeded ({cap}).")
 
-        proj = self._project_repo.get_project_by_id(project_id)
+        proj = self._project_repo.get_project_by_id(project_id, include_tasks=False)
         if not proj:
             raise ValueError("Project not found.")
 
@@ -37,18 +65,127 @@ class TaskService:
             deadline=parse_deadline(deadline_str),
         )
         self._task_repo.add_task(proj, task)
-        return task
+        return self._saved(task)
+
+    def add_tasks(self, *, project_id: str, items: Sequence[Mapping[str, Any]]) -> List[BulkTaskResult]:
+        """
+        Create many tasks in one go. Each item takes the keyword arguments of
+        add_task (title, description, status, deadline_str).
+
+        Invalid items are reported in their result and skipped; the valid ones
+        are inserted together in one transaction. The task cap is checked once
+        for the whole batch.
+        """
+        proj = self._project_repo.get_project_by_id(project_id, include_tasks=False)
+        if not proj:
+            raise ValueError("Project not found.")
+
+        results: List[BulkTaskResult] = []
+        tasks: List[Task] = []
+        for index, item in enumerate(items):
+            try:
+                task = Task(
+                    title=item["title"],
+                    description=item.get("description", ""),
+                    status=item.get("status", "todo"),
+                    deadline=parse_deadline(item.get("deadline_str")),
+                )
+            except ValueError as e:
+                results.append(BulkTaskResult(index=index, error=str(e)))
+                continue
+            tasks.append(task)
+            results.append(BulkTaskResult(index=index, task=task))
+
+        cap = get_settings().MAX_NUMBER_OF_TASK
+        if self._task_repo.count_tasks() + len(tasks) > cap:
+            raise ValueError(f"Task cap exceeded ({cap}).")
+
+        self._task_repo.add_tasks(proj, tasks)
+        for task in tasks:
+            self._saved(task)
+        return results
 
     def change_status(self, task_id: str, new_status: TaskStatus) -> Task:
-        return self._task_repo.change_task_status(task_id, new_status)
+        return self._saved(self._task_repo.change_task_status(task_id, new_status))
 
     def edit_task(self, task_id: str, **kwargs) -> Task:
-        return self._task_repo.update_task(task_id, **kwargs)
+        return self._saved(self._task_repo.update_task(task_id, **kwargs))
 
     def delete_task(self, task_id: str) -> None:
         ok = self._task_repo.delete_task(task_id)
         if not ok:
             raise ValueError("Task not found.")
 
+    def change_status_many(
+            self,
+            project_id: str,
+            new_status: TaskStatus,
+            *,
+            task_ids: Optional[Sequence[str]] = None,
+            task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        """Change the status of several tasks of a project at once; returns how many changed."""
+        if new_status not in ALLOWED_STATUSES:
+            raise ValueError("Invalid status. Allowed: todo | doing | done")
+        if task_ids is None and task_filter is None:
+            raise ValueError("Select tasks by ids and/or a filter.")
+        changed = self._task_repo.change_tasks_status(
+            project_id, new_status, task_ids=task_ids, task_filter=task_filter
+        )
+        if self._on_task_saved is not None:
+            for task_id, deadline in changed:
+                self._on_task_saved(task_id, deadline, new_status)
+        return len(changed)
+
+    def delete_tasks(
+            self,
+            project_id: str,
+            *,
+            task_ids: Optional[Sequence[str]] = None,
+            task_filter: Optional[TaskFilter] = None,
+    ) -> int:
+        """Delete several tasks of a project at once; returns how many were deleted."""
+        if task_ids is None and task_filter is None:
+            raise ValueError("Select tasks by ids and/or a filter.")
+        return self._task_repo.delete_tasks(project_id, task_ids=task_ids, task_filter=task_filter)
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        return self._task_repo.get_task_in_project(project_id, task_id)
+
+    def get_project_revision(self, project_id: str) -> Optional[int]:
+        """Version of the project and its tasks (None if the project does not exist)."""
+        return self._project_repo.get_project_revision(project_id)
+
     def list_tasks_of_project(self, project_id: str) -> List[Task]:
         return self._task_repo.list_tasks_of_project(project_id)
+
+    def list_tasks_page(self, project_id: str, *, limit: int,
+                        cursor: Optional[str] = None,
+                        task_filter: Optional[TaskFilter] = None,
+                        sort: TaskSort = "created_at") -> Page[Task]:
+        return self._task_repo.list_tasks_page(
+            project_id, limit=limit, cursor=cursor, task_filter=task_filter, sort=sort
+        )
+
+    def count_tasks_of_project(self, project_id: str,
+                               task_filter: Optional[TaskFilter] = None) -> int:
+        return self._task_repo.count_tasks(project_id, task_filter)
+
+    def query_tasks(self, task_filter: Optional[TaskFilter] = None, *, limit: int,
+                    cursor: Optional[str] = None,
+                    sort: TaskSort = "created_at") -> Page[Tuple[str, Task]]:
+        """Page of (project_id, task) pairs matching the filter across all projects."""
+        return self._task_repo.query_tasks(task_filter, limit=limit, cursor=cursor, sort=sort)
+
+    def count_tasks(self, task_filter: Optional[TaskFilter] = None) -> int:
+        return self._task_repo.count_tasks(None, task_filter)
+
+    def search_tasks(self, query: str, *, limit: int, cursor: Optional[str] = None,
+                     task_filter: Optional[TaskFilter] = None) -> Page[TaskSearchHit]:
+        """Ranked full-text search over task titles and descriptions."""
+        query = query.strip()
+        if not query:
+            raise ValueError("Search query must not be empty.")
+        return self._task_repo.search_tasks(
+            query, limit=limit, cursor=cursor, task_filter=task_filter
+        )